@@ -20,6 +20,7 @@ OPTIONS:
     --whisper small         Download small model (244MB, fast)
     --whisper medium        Download medium model (769MB, accurate)
     --whisper large         Download large-v3 model (2.9GB, highest accuracy)
+    --whisper large-v3-4bit Download 4-bit quantized large-v3 (880MB, faster, near large-v3 accuracy)
     --whisper small,medium  Download multiple (comma-separated, no spaces)
 
   TRANSLATION MODELS:
@@ -43,6 +44,7 @@ DISK SPACE REQUIRED:
     - small (244MB): ~300MB
     - medium (769MB): ~850MB
     - large-v3 (2.9GB): ~3.2GB
+    - large-v3-4bit (880MB): ~900MB
   Translation (per model):
     - Each translation model: ~100-200MB
     - Urdu: ~150MB
@@ -157,10 +159,19 @@ get_whisper_name() {
         medium) echo "medium (769MB, high accuracy)" ;;
         large-v3) echo "large-v3 (2.9GB, highest accuracy)" ;;
         large) echo "large-v3 (2.9GB, highest accuracy)" ;;
+        large-v3-4bit) echo "large-v3-4bit (880MB, quantized, fast)" ;;
         *) echo "$1" ;;
     esac
 }
 
+# Function to get whisper model Hugging Face repo
+get_whisper_repo() {
+    case "$1" in
+        large-v3-4bit) echo "mlx-community/whisper-large-v3-mlx-4bit" ;;
+        *) echo "mlx-community/whisper-$1-mlx" ;;
+    esac
+}
+
 # Function to get translation model path
 get_translation_model() {
     case "$1" in
@@ -181,8 +192,32 @@ get_lang_name() {
     esac
 }
 
+# Function to convert a cached translation model to int8 CTranslate2 (faster CPU inference)
+convert_translation_ct2() {
+    local model_name="$1"
+    local output_dir="$ct2_dir/${model_name##*/}"
+
+    if [ -f "$output_dir/model.bin" ]; then
+        return 0
+    fi
+    if ! command -v ct2-transformers-converter >/dev/null 2>&1; then
+        echo "   (ct2-transformers-converter not found, skipping int8 conversion)"
+        return 0
+    fi
+
+    echo "⚙️  Converting $model_name to CTranslate2 int8..."
+    mkdir -p "$ct2_dir"
+    if HF_HUB_OFFLINE=1 ct2-transformers-converter --model "$model_name" --output_dir "$output_dir" --quantization int8 >/dev/null 2>&1; then
+        echo "✓ int8 translator saved to $output_dir"
+    else
+        rm -rf "$output_dir"
+        echo "   (int8 conversion failed, the transformers model will be used)"
+    fi
+}
+
 failed=0
 cache_dir="$HOME/.cache/huggingface/hub"
+ct2_dir="$HOME/.cache/whisper-dictation/ct2"
 
 echo "═══════════════════════════════════════════════════════════════"
 echo "1️⃣  WHISPER MODELS (Speech-to-Text)"
@@ -196,7 +231,8 @@ for model in "${whisper_models[@]}"; do
     fi
 
     model_name=$(get_whisper_name "$model")
-    model_cache="models--mlx-community--whisper-${model}-mlx"
+    model_repo=$(get_whisper_repo "$model")
+    model_cache="models--${model_repo//\//--}"
 
     if [ -d "$cache_dir/$model_cache" ]; then
         echo "✓ $model_name (already cached, skipping)"
@@ -212,7 +248,7 @@ import mlx_whisper
 import os
 try:
     # This will download to cache
-    result = mlx_whisper.transcribe('/dev/null', path_or_hf_repo='mlx-community/whisper-${model}-mlx')
+    result = mlx_whisper.transcribe('/dev/null', path_or_hf_repo='${model_repo}')
     print('✓ ${model} downloaded successfully')
 except Exception as e:
     # Expected error (invalid audio), but model is downloaded
@@ -254,6 +290,7 @@ for lang in "${translation_langs[@]}"; do
 
     if [ -d "$cache_dir/$model_cache" ]; then
         echo "✓ $lang_pair (already cached, skipping)"
+        convert_translation_ct2 "$model_name"
         echo ""
         continue
     fi
@@ -276,6 +313,7 @@ except Exception as e:
         continue
     }
 
+    convert_translation_ct2 "$model_name"
     echo ""
 done
 
@@ -1,9 +1,35 @@
+import atexit
+import functools
+import io
 import logging
+import logging.handlers
 import os
-from dotenv import load_dotenv
+import queue
+import sys
+import threading
+import time
+
+# Resolve environment-driven settings once at import (main.py loads .env before importing us)
+# Colors only when enabled and stderr is an actual terminal (not piped to a file or log collector)
+_USE_COLORS = os.getenv('NO_COLOR', 'false').lower() != 'true' and sys.stderr.isatty()
+_LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARNING': 30, 'WARN': 30, 'ERROR': 40, 'CRITICAL': 50, 'FATAL': 50}
+_LOG_LEVEL = _LEVELS.get(os.getenv('LOG_LEVEL', 'INFO').upper(), logging.INFO)
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+DATE_FORMAT = '%H:%M:%S'
+
+_root = logging.getLogger()
+_isEnabledFor = _root.isEnabledFor
+
+# Background listener that owns the real stream handler (shared across setup_logging calls)
+_listener = None
 
 class ColoredFormatter(logging.Formatter):
-    """Custom logging formatter with color support."""
+    """Custom logging formatter with color support.
+
+    Colors are applied to the rendered line only; record.levelname is never
+    modified, so other handlers sharing the record see the plain level name.
+    """
     
     COLORS = {
         'DEBUG': '\033[36m',    # Cyan
@@ -13,50 +39,196 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': '\033[1;31m' # Bold Red
     }
     RESET = '\033[0m'
+    # Level names indexed by levelno // 10 (NOTSET, DEBUG, INFO, WARNING, ERROR, CRITICAL)
+    LEVEL_SLOTS = (None, 'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.use_colors = os.getenv('NO_COLOR', 'false').lower() != 'true'
+    def __init__(self, fmt=LOG_FORMAT, datefmt=DATE_FORMAT, *args, level_width=0, **kwargs):
+        super().__init__(fmt, datefmt, *args, **kwargs)
+        self.use_colors = _USE_COLORS
+        self.level_width = level_width
+
+        # The standard layout is rendered directly in formatMessage, skipping the % template engine
+        self._fast_path = self._fmt == LOG_FORMAT
+
+        # Color prefixes and rendered (colored, padded) level names, indexed by levelno // 10
+        # so each record does a tuple index instead of a dict lookup and string padding
+        self._prefixes = tuple(
+            self.COLORS[level] if level and self.use_colors else '' for level in self.LEVEL_SLOTS
+        )
+        self._levels = tuple(
+            self._render_level(level, color) if level else ''
+            for level, color in zip(self.LEVEL_SLOTS, self._prefixes)
+        )
+
+        # Last formatted timestamp, reused for all records within the same second
+        self._ts_sec = -1
+        self._ts_str = ''
+
+    def formatTime(self, record, datefmt=None):
+        # Second-granularity formats only change once per second; default format needs msecs
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        if sec != self._ts_sec:
+            self._ts_str = time.strftime(datefmt, self.converter(sec))
+            self._ts_sec = sec
+        return self._ts_str
+
+    def usesTime(self):
+        # Constant for the standard layout instead of scanning the template on every record
+        return True if self._fast_path else super().usesTime()
     
     def format(self, record):
-        if self.use_colors:
-            level_color = self.COLORS.get(record.levelname, '')
-            record.levelname = f"{level_color}{record.levelname}{self.RESET}"
-            
-            log_message = super().format(record)
-            
-            if level_color:
-                parts = log_message.split(' - ', 2)
-                if len(parts) >= 3:
-                    timestamp, level, message = parts[0], parts[1], ' - '.join(parts[2:])
-                    return f"{timestamp} - {level} - {level_color}{message}{self.RESET}"
-            
-            return log_message
-        else:
+        if not self._fast_path:
             return super().format(record)
 
+        # Inline getMessage(): most records have no args, so skip the % interpolation
+        msg = record.msg if isinstance(record.msg, str) else str(record.msg)
+        record.message = msg % record.args if record.args else msg
+        record.asctime = self.formatTime(record, self.datefmt)
+        s = self.formatMessage(record)
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            s = f"{s}\n{record.exc_text}"
+        if record.stack_info:
+            s = f"{s}\n{self.formatStack(record.stack_info)}"
+        return s
+
+    def _render_level(self, levelname, color):
+        padded = f"{levelname:<{self.level_width}}"
+        return f"{color}{padded}{self.RESET}" if color else padded
+
+    def formatMessage(self, record):
+        if not self._fast_path:
+            return super().formatMessage(record)
+
+        slot = record.levelno // 10
+        if 0 <= slot < len(self.LEVEL_SLOTS) and record.levelname == self.LEVEL_SLOTS[slot]:
+            level = self._levels[slot]
+            color = self._prefixes[slot]
+        else:
+            # Custom level names are rendered on the fly, uncolored
+            level = self._render_level(record.levelname, '')
+            color = ''
+
+        if color:
+            return f"{record.asctime} - {level} - {color}{record.message}{self.RESET}"
+        return f"{record.asctime} - {level} - {record.message}"
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that batches writes and flushes on WARNING+ or after a short delay.
+
+    Delayed flushes come from one long-lived flusher thread; close() stops it and
+    flushes whatever is still buffered.
+    """
+
+    def __init__(self, stream=None, flush_interval=0.2, encoding='utf-8'):
+        super().__init__(stream)
+        self.flush_interval = flush_interval
+        self.encoding = encoding
+        # Set when buffered records are waiting for the flusher; cleared by flush()
+        self._dirty = threading.Event()
+        self._closing = threading.Event()
+        # Binary streams get one pre-encoded write per record instead of going through a text codec layer
+        self._binary = not isinstance(self.stream, io.TextIOBase)
+        self._flusher = threading.Thread(target=self._flush_loop, name='log-flusher', daemon=True)
+        self._flusher.start()
+
+    def _flush_loop(self):
+        """Flush flush_interval after the first unflushed record, until close()"""
+        while not self._closing.is_set():
+            self._dirty.wait()
+            self._closing.wait(self.flush_interval)
+            self.flush()
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            if self._binary:
+                self.stream.write(msg.encode(self.encoding, 'replace'))
+            else:
+                self.stream.write(msg)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+            else:
+                self._dirty.set()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            self._dirty.clear()
+            super().flush()
+        except (OSError, ValueError):
+            # Stream already closed (e.g. during interpreter shutdown)
+            pass
+        finally:
+            self.release()
+
+    def close(self):
+        self._closing.set()
+        self._dirty.set()  # Wake the flusher so it exits
+        self.flush()
+        super().close()
+
+# Single shared formatter instance for the stderr handler
+_FORMATTER = ColoredFormatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+
+def _buffered_stderr():
+    """Open a 64KB-buffered binary writer on stderr's fd (falls back to plain stderr if it has none)"""
+    try:
+        # Our own FileIO with closefd=False, so closing/collecting the buffer never closes sys.stderr
+        raw = io.FileIO(sys.stderr.fileno(), 'wb', closefd=False)
+    except (AttributeError, OSError, ValueError):
+        return sys.stderr
+    return io.BufferedWriter(raw, buffer_size=65536)
+
+def log_debug(fmt, *args):
+    """Log a %-style debug message, skipping all formatting work when DEBUG is disabled"""
+    if _isEnabledFor(logging.DEBUG):
+        _root.debug(fmt, *args)
+
+@functools.cache
 def setup_logging():
-    """Setup logging configuration with color support."""
-    load_dotenv()
-    
-    log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
-    
-    for handler in logging.root.handlers[:]:
-        logging.root.removeHandler(handler)
-    
-    logging.basicConfig(
-        level=getattr(logging, log_level, logging.INFO),
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        datefmt='%H:%M:%S',
-        handlers=[]
-    )
-    
-    handler = logging.StreamHandler()
-    handler.setFormatter(ColoredFormatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S'))
-    
+    """Setup logging configuration with color support.
+
+    Records are pushed onto a queue and written to stderr by a background
+    QueueListener so callers never block on terminal I/O. The result is
+    cached, so only the first call configures logging; later calls return
+    the same root logger.
+    Tests can call setup_logging.cache_clear() to force a fresh setup.
+    """
+    global _listener
+
+    if _listener is not None:
+        # Reconfiguring after cache_clear(): retire the previous pipeline first
+        atexit.unregister(_listener.stop)
+        _listener.stop()
+        for handler in _listener.handlers:
+            atexit.unregister(handler.close)
+            handler.close()
+
+    # Our format never shows thread/process info, so skip collecting it per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    # Handler errors only print tracebacks when debugging; end users never see them
+    logging.raiseExceptions = _LOG_LEVEL <= logging.DEBUG
+
+    handler = BufferedStreamHandler(_buffered_stderr(), encoding=getattr(sys.stderr, 'encoding', None) or 'utf-8')
+    handler.setFormatter(_FORMATTER)
+    _listener = logging.handlers.QueueListener(queue.SimpleQueue(), handler, respect_handler_level=True)
+    _listener.start()
+    # atexit runs these last-in first-out: drain the queue, then flush and stop the flusher
+    atexit.register(handler.close)
+    atexit.register(_listener.stop)
+
     logger = logging.getLogger()
-    logger.handlers = []
-    logger.addHandler(handler)
-    logger.setLevel(getattr(logging, log_level, logging.INFO))
-    
-    return logger
\ No newline at end of file
+    logger.handlers.clear()
+    logger.addHandler(logging.handlers.QueueHandler(_listener.queue))
+    logger.setLevel(_LOG_LEVEL)
+
+    return logger
@@ -1,11 +1,19 @@
 #!/usr/bin/env python3
 import os
+import re
 import time
+import hashlib
+import io
+import json
+import mmap
 import tempfile
+import shutil
+import struct
+import platform
+import queue
 import threading
 import subprocess
 import pyaudio
-import wave
 import numpy as np
 import rumps
 from pynput import keyboard
@@ -13,7 +21,10 @@ from pynput.keyboard import Key, Controller
 import faster_whisper
 import signal
 import warnings
-from AppKit import NSAlert, NSAlertFirstButtonReturn, NSAlertSecondButtonReturn
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from AppKit import NSAlert, NSAlertFirstButtonReturn, NSAlertSecondButtonReturn, NSTextField, NSMakeRect, NSWorkspace
 
 # Suppress numpy warnings from faster-whisper audio processing
 warnings.filterwarnings("ignore", category=RuntimeWarning, module="faster_whisper.feature_extractor")
@@ -26,18 +37,68 @@ try:
     AVFOUNDATION_AVAILABLE = True
 except ImportError:
     AVFOUNDATION_AVAILABLE = False
-from text_selection import TextSelection
-from openai_client import OpenAIClient
+try:
+    from AVFoundation import AVAudioPlayer
+    from Foundation import NSURL
+    AVAUDIOPLAYER_AVAILABLE = True
+except ImportError:
+    AVAUDIOPLAYER_AVAILABLE = False
+from dotenv import load_dotenv
+
+# Load .env before the app modules below read their settings (LOG_LEVEL, NO_COLOR) at import
+load_dotenv()
+from text_selection import TextSelection, PASTE_SETTLE, _PASTEBOARD_LOCK
+from openai_client import OpenAIClient, EnhancementTruncated
 from task_manager import TaskManager
 from recording_indicator import RecordingIndicator
-from logger_config import setup_logging
-from mlx_whisper_client import MLXWhisperClient
+from logger_config import setup_logging, log_debug
+from mlx_whisper_client import MLXWhisperClient, HF_CACHE_DIR
 
 # Suppress multiprocessing resource tracker warnings on shutdown
 warnings.filterwarnings("ignore", category=UserWarning, module="multiprocessing.resource_tracker")
 
 logger = setup_logging()
 
+# External audio players (fallback when AVAudioPlayer is unavailable), resolved once at import.
+# Each entry is (name, command prefix); the audio file path is appended at play time.
+_AUDIO_PLAYERS = [
+    (name, [path] + args)
+    for name, args in (
+        ('afplay', []),
+        ('mpg123', ['-q']),
+        ('ffplay', ['-nodisp', '-autoexit', '-loglevel', 'quiet']),
+    )
+    if (path := shutil.which(name))
+]
+
+# int16 PCM -> float32 scale factor, and the sample count above which conversion is split across threads
+_PCM_SCALE = np.float32(1 / 32768.0)
+_PARALLEL_CONVERT_MIN = 4 * 1024 * 1024  # ~4.4 minutes at 16kHz
+
+def pcm16_to_float32(src, dst):
+    """
+    Scale int16 PCM samples into a preallocated float32 buffer in [-1, 1).
+    Long recordings are split into chunks converted on several threads; numpy
+    releases the GIL inside the ufunc, so the chunks run on separate cores.
+
+    Args:
+        src: int16 sample array
+        dst: float32 array of the same length (written in place)
+    """
+    workers = min(os.cpu_count() or 1, 8)
+    if len(src) < _PARALLEL_CONVERT_MIN or workers == 1:
+        np.multiply(src, _PCM_SCALE, out=dst)
+        return
+
+    bounds = np.linspace(0, len(src), workers + 1, dtype=np.int64)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(np.multiply, src[start:end], _PCM_SCALE, out=dst[start:end])
+            for start, end in zip(bounds[:-1], bounds[1:])
+        ]
+        for future in futures:
+            future.result()
+
 # Set up a global flag for handling SIGINT
 exit_flag = False
 exit_event = threading.Event()
@@ -155,7 +216,64 @@ def signal_handler(sig, frame):
 signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
+def model_snapshot_dir(repo_id):
+    """Path of a Hugging Face model's snapshots directory in the local cache"""
+    return os.path.join(HF_CACHE_DIR, f"models--{repo_id.replace('/', '--')}", "snapshots")
+
+def model_snapshot_cached(repo_id):
+    """
+    Check whether a Hugging Face model has a downloaded snapshot in the local cache.
+
+    Args:
+        repo_id: Hugging Face repo id (e.g. "mlx-community/whisper-large-v3-mlx")
+
+    Returns:
+        bool: True if at least one snapshot directory exists
+    """
+    try:
+        return any(entry.is_dir() for entry in os.scandir(model_snapshot_dir(repo_id)))
+    except OSError:
+        return False
+
+def prefetch_model_weights(repo_id):
+    """
+    Ask the OS to start reading a cached Hugging Face model's weight files into the
+    page cache, so the model loader's reads hit memory instead of disk. Only issues
+    read-ahead hints (posix_fadvise, or madvise on macOS) - it never reads the files
+    itself, which for large-v3 would be GBs of I/O competing with the real load.
+    Runs on a daemon thread and is a no-op if the model hasn't been downloaded yet.
+
+    Args:
+        repo_id: Hugging Face repo id (e.g. "mlx-community/whisper-large-v3-mlx")
+    """
+    snapshots = model_snapshot_dir(repo_id)
+    if not os.path.isdir(snapshots):
+        return
+
+    def prefetch():
+        for root, _, files in os.walk(snapshots):
+            for name in files:
+                if not name.endswith(('.bin', '.safetensors', '.npz')):
+                    continue
+                try:
+                    with open(os.path.join(root, name), 'rb') as f:
+                        if hasattr(os, 'posix_fadvise'):
+                            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                        elif hasattr(mmap, 'MADV_WILLNEED'):
+                            # macOS has no posix_fadvise; madvise on a mapping gives the same hint
+                            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                                mapped.madvise(mmap.MADV_WILLNEED)
+                except (OSError, ValueError) as e:
+                    logger.debug(f"Weight prefetch skipped {name}: {e}")
+
+    threading.Thread(target=prefetch, daemon=True).start()
+
 class WhisperDictationApp(rumps.App):
+    # Voice command prefixes that route an utterance to the task manager
+    TASK_PREFIXES = ('task', 'todo', 'to do')
+    # Words in a voice instruction that mean "read the selected text aloud"
+    TTS_REQUEST_RE = re.compile(r'\b(?:read|speak|say)\b', re.IGNORECASE)
+
     def __init__(self):
         super(WhisperDictationApp, self).__init__("🎙️", quit_button=rumps.MenuItem("Quit"))
 
@@ -173,26 +291,33 @@ class WhisperDictationApp(rumps.App):
         # Add menu items - use a single menu item for toggling recording
         self.recording_menu_item = rumps.MenuItem("Start Recording")
 
+        # Shared worker threads for long per-event jobs (transcription, TTS, typed tasks);
+        # latency-critical key and menu handling keeps dedicated threads so it never
+        # queues behind them. Submit through _submit so failures get logged
+        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='whisper')
+
         # Recording state
         self.recording = False
         self.recording_start_time = None  # Track when recording started
-        self.audio = pyaudio.PyAudio()
-        self.frames = []
+        self.max_duration_timer = None  # Auto-stops a recording at max_recording_duration
+        self.indicator = None  # RecordingIndicator, created once the menu is built
+        self.audio = None  # PyAudio instance, created by _init_audio_async
+        self.audio_ready = threading.Event()  # Set once PyAudio and the input stream are initialized
         self.keyboard_controller = Controller()
         self.cached_selected_text = None  # Cache selected text when recording stops
 
         # App lifecycle tracking
-        self.last_activity_time = time.time()
+        self.last_activity_time = time.monotonic()  # Monotonic, so wall-clock changes never skew the inactivity timer
         self.max_inactivity_time = 4 * 60 * 60  # 4 hours of inactivity
         self.max_recording_duration = 15 * 60  # 15 minutes in seconds
 
         # Microphone selection (None = use default)
         self.selected_input_device = None  # Use default (MacBook Pro Microphone)
 
-        # Create microphone selection submenu
+        # Microphone selection submenu, populated by _init_audio_async once devices are enumerated
         self.mic_menu = {}
         self.mic_menu_mapping = {}  # Maps menu title to device index
-        self.setup_microphone_menu()
+        self.mic_submenu = rumps.MenuItem("Microphone (Loading devices…)")
 
         # Add TTS menu items with speed submenu
         self.tts_speed = 1.0  # Default speed (1.0x)
@@ -210,7 +335,12 @@ class WhisperDictationApp(rumps.App):
         self.stop_tts_menu_item = rumps.MenuItem("Stop Reading")
         self.stop_tts_menu_item.set_callback(self.stop_tts)
 
-        # Track current audio playback process
+        # Rendered TTS audio cache, keyed by voice/speed/text hash
+        self.tts_cache_dir = Path(tempfile.gettempdir()) / "whisper_tts_cache"
+        self.tts_cache_max_bytes = 200 * 1024 * 1024  # 200 MB
+
+        # Track current audio playback (in-process AVAudioPlayer or fallback player process)
+        self.current_audio_player = None
         self.current_audio_process = None
         self.audio_process_lock = threading.Lock()
 
@@ -224,6 +354,8 @@ class WhisperDictationApp(rumps.App):
         self.task_manager = TaskManager(openai_client=self.openai_client)
 
         # Task submenu will be created in setup_task_menu() (must be after task_manager init)
+        self.task_submenu = None
+        self.task_menu_state = None  # What the task submenu currently shows, to skip no-op rebuilds
         self.setup_task_menu()
 
         # Initially hide the stop button
@@ -242,23 +374,45 @@ class WhisperDictationApp(rumps.App):
         self.indicator = RecordingIndicator()
         self.indicator.set_app_reference(self)
 
+        # Audio level metering runs on its own thread so the capture callback only copies samples
+        self.level_queue = queue.Queue(maxsize=1)
+        threading.Thread(target=self._level_worker, daemon=True).start()
+
         # Initialize transcription backend (MLX, faster-whisper, or OpenAI)
         self.model = None
+        self.batched_model = None  # BatchedInferencePipeline for long recordings (faster-whisper)
+        self.use_batched_whisper = os.getenv('USE_BATCHED_WHISPER', 'true').lower() == 'true'
         self.mlx_client = None
-        self.use_mlx_whisper = os.getenv('USE_MLX_WHISPER', 'false').lower() == 'true'
+        mlx_model_size = os.getenv('MLX_WHISPER_MODEL', 'large-v3')
+        mlx_repo = MLXWhisperClient.model_map.get(mlx_model_size, "mlx-community/whisper-large-v3-mlx")
+        use_mlx_setting = os.getenv('USE_MLX_WHISPER')
+        if use_mlx_setting is not None:
+            self.use_mlx_whisper = use_mlx_setting.lower() == 'true'
+        elif platform.machine() == 'arm64' and not self.openai_client.use_openai_whisper:
+            # MLX runs on the Apple Silicon GPU, so it is the default local backend on arm64
+            # Macs - but only once its weights are downloaded; otherwise every transcription
+            # would fail on a fresh install
+            self.use_mlx_whisper = model_snapshot_cached(mlx_repo)
+            if not self.use_mlx_whisper:
+                logger.info(f"MLX Whisper model {mlx_repo} not found in {HF_CACHE_DIR} - "
+                            f"using faster-whisper (set USE_MLX_WHISPER=true to use MLX)")
+        else:
+            self.use_mlx_whisper = False
 
         if self.use_mlx_whisper:
+            # Start pulling weights into the page cache while the rest of the app initializes
+            prefetch_model_weights(mlx_repo)
             # Load MLX Whisper model
             self.load_mlx_thread = threading.Thread(target=self.load_mlx_model)
             self.load_mlx_thread.start()
         elif not self.openai_client.use_openai_whisper:
+            prefetch_model_weights("Systran/faster-whisper-medium.en")
             # Load local faster-whisper model
             self.load_model_thread = threading.Thread(target=self.load_model)
             self.load_model_thread.start()
         else:
             # Using cloud API - model not needed
-            self.title = "🎙️"
-            self.status_item.title = "Status: Ready (Cloud API)"
+            self._set_ui("🎙️", "Status: Ready (Cloud API)")
             logger.info("Using OpenAI Whisper API - skipping local model load")
         
         # Audio recording parameters
@@ -266,6 +420,30 @@ class WhisperDictationApp(rumps.App):
         self.channels = 1
         self.rate = 16000
         self.chunk = 1024
+
+        # Canonical 44-byte PCM WAV header for the capture format; sizes are patched in per recording
+        sample_width = pyaudio.get_sample_size(self.format)
+        self.wav_header = struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 36, b'WAVE',
+            b'fmt ', 16, 1, self.channels, self.rate,
+            self.rate * self.channels * sample_width, self.channels * sample_width, sample_width * 8,
+            b'data', 0,
+        )
+
+        # Preallocated capture buffer covering the maximum recording length; the stream
+        # callback copies samples straight into it instead of appending a bytes object per chunk
+        self.audio_buf = np.empty(self.rate * self.max_recording_duration, dtype=np.int16)
+        self.write_idx = 0
+        # Reusable float32 scratch for the Whisper input (guarded by float_scratch_lock)
+        self.float_scratch = np.empty(len(self.audio_buf), dtype=np.float32)
+        self.float_scratch_lock = threading.Lock()
+
+        # Input stream kept open (stopped) between recordings so each press skips device negotiation
+        self.stream = None
+
+        # PyAudio init and device enumeration probe CoreAudio per device; keep them off the startup path
+        threading.Thread(target=self._init_audio_async, daemon=True).start()
         
         # Hotkey configuration - we'll listen for globe/fn key (vk=63)
         self.trigger_key = 63  # Key code for globe/fn key
@@ -382,10 +560,11 @@ class WhisperDictationApp(rumps.App):
         self.watchdog.start()
     
     def check_exit_flag(self):
-        """Monitor the exit flag, app runtime, and recording duration"""
+        """Wait for the exit signal, waking otherwise only when the inactivity limit may be reached"""
         while True:
-            # Check for exit flag
-            if exit_flag:
+            # Sleep until shutdown is requested or the inactivity deadline comes up
+            remaining = self.max_inactivity_time - (time.monotonic() - self.last_activity_time)
+            if exit_event.wait(timeout=max(remaining, 0)):
                 try:
                     self.cleanup()
                 except Exception as e:
@@ -394,8 +573,8 @@ class WhisperDictationApp(rumps.App):
                 os._exit(0)
                 break
 
-            # Check if app has been inactive too long (4 hours)
-            inactive_time = time.time() - self.last_activity_time
+            # Check if app has been inactive too long (4 hours); activity may have pushed the deadline out
+            inactive_time = time.monotonic() - self.last_activity_time
             if inactive_time > self.max_inactivity_time:
                 logger.warning(f"⚠️  No activity for {inactive_time/3600:.1f} hours - auto-shutting down for safety")
                 rumps.notification(
@@ -409,37 +588,60 @@ class WhisperDictationApp(rumps.App):
                 os._exit(0)
                 break
 
-            # Check if recording has been running too long (15 minutes)
-            if self.recording and self.recording_start_time:
-                recording_duration = time.time() - self.recording_start_time
-                if recording_duration > self.max_recording_duration:
-                    logger.warning(f"⚠️  Recording has been running for {recording_duration/60:.1f} minutes - auto-stopping")
-                    rumps.notification(
-                        title="Recording Auto-Stopped",
-                        subtitle="Recording exceeded 15 minutes",
-                        message="Recording automatically stopped for safety. Please start a new recording if needed."
-                    )
-                    # Stop recording
-                    self.stop_recording()
+    def _auto_stop_recording(self):
+        """Timer callback: stop a recording that has hit the maximum duration (15 minutes)"""
+        if not self.recording:
+            return
+        recording_duration = time.time() - (self.recording_start_time or time.time())
+        logger.warning(f"⚠️  Recording has been running for {recording_duration/60:.1f} minutes - auto-stopping")
+        rumps.notification(
+            title="Recording Auto-Stopped",
+            subtitle="Recording exceeded 15 minutes",
+            message="Recording automatically stopped for safety. Please start a new recording if needed."
+        )
+        # Stop recording
+        self.stop_recording()
 
-            time.sleep(0.5)
+    def _cancel_max_duration_timer(self):
+        """Cancel the pending max-duration auto-stop, if any"""
+        if self.max_duration_timer is not None:
+            self.max_duration_timer.cancel()
+            self.max_duration_timer = None
     
+    def _submit(self, fn, *args):
+        """
+        Run fn(*args) on the shared worker pool, logging any exception it raises.
+
+        Returns:
+            Future for the submitted call
+        """
+        def log_failure(future):
+            if not future.cancelled() and future.exception() is not None:
+                exc = future.exception()
+                logger.error(f"❌ Background task {fn.__name__} failed: {exc}",
+                             exc_info=(type(exc), exc, exc.__traceback__))
+
+        future = self.executor.submit(fn, *args)
+        future.add_done_callback(log_failure)
+        return future
+
     def cleanup(self):
         """Clean up resources before exiting"""
         logger.info("Shutting down...")
 
         try:
             # Stop recording if in progress
-            if self.recording:
-                self.recording = False
-                if hasattr(self, 'recording_thread') and self.recording_thread.is_alive():
-                    try:
-                        self.recording_thread.join(timeout=1.0)
-                    except Exception as e:
-                        logger.debug(f"Error stopping recording thread: {e}")
+            self.recording = False
+            self._close_stream()
+            self.executor.shutdown(wait=False, cancel_futures=True)
 
             # Stop any playing audio
-            if hasattr(self, 'current_audio_process') and self.current_audio_process:
+            if self.current_audio_player is not None:
+                try:
+                    self.current_audio_player.stop()
+                except Exception as e:
+                    logger.debug(f"Error stopping audio player: {e}")
+            if self.current_audio_process is not None:
                 try:
                     if self.current_audio_process.poll() is None:
                         self.current_audio_process.terminate()
@@ -448,15 +650,20 @@ class WhisperDictationApp(rumps.App):
                     logger.debug(f"Error stopping audio: {e}")
 
             # Close recording indicator if active
-            if hasattr(self, 'indicator'):
+            if self.indicator is not None:
                 try:
-                    if hasattr(self.indicator, 'stop'):
-                        self.indicator.stop()
+                    self.indicator.stop()
                 except Exception as e:
                     logger.debug(f"Error closing indicator: {e}")
 
+            # Leave a complete task file snapshot behind
+            try:
+                self.task_manager.compact()
+            except Exception as e:
+                logger.debug(f"Error compacting task log: {e}")
+
             # Close PyAudio properly
-            if hasattr(self, 'audio'):
+            if self.audio is not None:
                 try:
                     self.audio.terminate()
                 except Exception as e:
@@ -467,38 +674,47 @@ class WhisperDictationApp(rumps.App):
     
     def load_mlx_model(self):
         """Load MLX Whisper model (optimized for Apple Silicon)"""
-        self.title = "🎙️ (Loading MLX...)"
-        self.status_item.title = "Status: Loading MLX Whisper model..."
+        self._set_ui("🎙️ (Loading MLX...)", "Status: Loading MLX Whisper model...")
         try:
             model_size = os.getenv('MLX_WHISPER_MODEL', 'large-v3')
             self.mlx_client = MLXWhisperClient(model_size=model_size)
-            self.title = "🎙️"
-            self.status_item.title = "Status: Ready (MLX Local)"
+            self._set_ui("🎙️", "Status: Ready (MLX Local)")
             logger.info(f"MLX Whisper model ({model_size}) loaded successfully!")
         except Exception as e:
-            self.title = "🎙️ (Error)"
-            self.status_item.title = "Status: Error loading MLX model"
+            self._set_ui("🎙️ (Error)", "Status: Error loading MLX model")
             logger.error(f"Error loading MLX Whisper model: {e}")
             # Fall back to faster-whisper
             logger.info("Falling back to faster-whisper...")
             self.load_model()
 
     def load_model(self):
-        self.title = "🎙️ (Loading...)"
-        self.status_item.title = "Status: Loading Whisper model..."
+        self._set_ui("🎙️ (Loading...)", "Status: Loading Whisper model...")
         try:
-            self.model = faster_whisper.WhisperModel("medium.en", compute_type="float32")
-            self.title = "🎙️"
-            self.status_item.title = "Status: Ready"
+            # int8 weights cut memory traffic per decoding step vs float32 (CTranslate2 quantizes on load)
+            compute_type = os.getenv('WHISPER_COMPUTE', 'int8')
+            self.model = faster_whisper.WhisperModel("medium.en", device="auto", compute_type=compute_type)
+            if self.use_batched_whisper:
+                # Batches VAD-segmented chunks through the model in one pass for long recordings
+                self.batched_model = faster_whisper.BatchedInferencePipeline(model=self.model)
+            self._set_ui("🎙️", "Status: Ready")
             logger.info("Whisper model loaded successfully!")
         except Exception as e:
-            self.title = "🎙️ (Error)"
-            self.status_item.title = "Status: Error loading model"
+            self._set_ui("🎙️ (Error)", "Status: Error loading model")
             logger.error(f"Error loading model: {e}")
 
+    def _init_audio_async(self):
+        """Background thread: create PyAudio, enumerate input devices, and open the input stream"""
+        try:
+            self.audio = pyaudio.PyAudio()
+            self.setup_microphone_menu()
+            self._open_stream()
+        except Exception as e:
+            logger.warning(f"Could not initialize audio input: {e}")
+        finally:
+            self.audio_ready.set()
+
     def setup_microphone_menu(self):
         """Setup the microphone selection submenu"""
-        self.mic_submenu = rumps.MenuItem("Microphone")
         devices = self.get_input_devices()
 
         for device in devices:
@@ -515,6 +731,8 @@ class WhisperDictationApp(rumps.App):
             self.mic_menu_mapping[title] = device['index']
             self.mic_submenu.add(menu_item)
 
+        self.mic_submenu.title = "Microphone"
+
     def setup_global_monitor(self):
         # Create a separate thread to monitor for global key events
         self.key_monitor_thread = threading.Thread(target=self.monitor_keys)
@@ -548,16 +766,23 @@ class WhisperDictationApp(rumps.App):
         device_name = sender.title.replace(" (Default)", "")
         logger.info(f"Microphone changed to: {device_name}")
 
+        # The persistent stream is bound to a device, so reopen it on the new one
+        try:
+            self._open_stream()
+            if self.recording:
+                self.stream.start_stream()
+        except Exception as e:
+            logger.error(f"Error reopening audio stream: {e}")
+
     def discard_recording(self):
         """Discard current recording without processing (held too short)"""
         self.recording = False
         self.recording_start_time = None  # Clear recording start time
-        if hasattr(self, 'recording_thread') and self.recording_thread.is_alive():
-            self.recording_thread.join(timeout=0.5)
-        self.frames = []
+        self._cancel_max_duration_timer()
+        self._pause_stream()
+        self.write_idx = 0
         self.indicator.stop()
-        self.title = "🎙️"
-        self.status_item.title = "Status: Recording discarded (too short)"
+        self._set_ui("🎙️", "Status: Recording discarded (too short)")
         logger.info("Recording discarded - held for less than threshold")
     
     def monitor_keys(self):
@@ -566,25 +791,26 @@ class WhisperDictationApp(rumps.App):
 
         def on_press(key):
             try:
-                # If Right Shift is held and another key is pressed, cancel recording (user is typing)
-                if self.shift_held and key != Key.shift_r:
-                    logger.debug("Other key pressed while Right Shift held - canceling recording")
-                    self.shift_held = False
-                    self.discard_recording()
+                # Only Right Shift matters on press; ordinary typing returns before any other work
+                if key != Key.shift_r:
+                    # If Right Shift is held and another key is pressed, cancel recording (user is typing)
+                    if self.shift_held:
+                        log_debug("Other key pressed while Right Shift held - canceling recording")
+                        self.shift_held = False
+                        self.discard_recording()
                     return
 
                 # Right Shift handling - mark as pressed (will start recording after delay check)
-                if key == Key.shift_r:
-                    if not self.recording and not self.shift_held:
-                        self.shift_press_time = time.time()
-                        self.shift_held = True
-                        # Start a thread to check if key is still held after 0.3s (to avoid accidental triggers)
-                        def delayed_recording_start():
-                            time.sleep(0.3)
-                            if self.shift_held and time.time() - self.shift_press_time >= 0.3:
-                                if not self.recording:
-                                    self.start_recording()
-                        threading.Thread(target=delayed_recording_start, daemon=True).start()
+                if not self.recording and not self.shift_held:
+                    self.shift_press_time = time.time()
+                    self.shift_held = True
+                    # Start a thread to check if key is still held after 0.3s (to avoid accidental triggers)
+                    def delayed_recording_start():
+                        time.sleep(0.3)
+                        if self.shift_held and time.time() - self.shift_press_time >= 0.3:
+                            if not self.recording:
+                                self.start_recording()
+                    threading.Thread(target=delayed_recording_start, daemon=True).start()
             except UnicodeDecodeError:
                 # Ignore unicode errors from special characters
                 pass
@@ -593,27 +819,27 @@ class WhisperDictationApp(rumps.App):
 
         def on_release(key):
             try:
-                if hasattr(key, 'vk'):
-                    if key.vk == self.trigger_key:
-                        # Debouncing - ignore if Globe/Fn was pressed too recently
-                        current_time = time.time()
-                        time_since_last = current_time - self.last_globe_key_time
-
-                        if time_since_last < self.globe_key_debounce:
-                            logger.debug(f"Globe/Fn key debounced ({time_since_last:.3f}s since last press)")
-                            return
-
-                        self.last_globe_key_time = current_time
-
-                        if not self.recording and not self.is_recording_with_key63:
-                            self.is_recording_with_key63 = True
-                            self.start_recording()
-                        elif self.recording and self.is_recording_with_key63:
-                            self.is_recording_with_key63 = False
-                            self.stop_recording()
+                # Only the Globe/Fn trigger key and Right Shift matter on release
+                if getattr(key, 'vk', None) == self.trigger_key:
+                    # Debouncing - ignore if Globe/Fn was pressed too recently
+                    current_time = time.time()
+                    time_since_last = current_time - self.last_globe_key_time
+
+                    if time_since_last < self.globe_key_debounce:
+                        log_debug("Globe/Fn key debounced (%.3fs since last press)", time_since_last)
+                        return
+
+                    self.last_globe_key_time = current_time
+
+                    if not self.recording and not self.is_recording_with_key63:
+                        self.is_recording_with_key63 = True
+                        self.start_recording()
+                    elif self.recording and self.is_recording_with_key63:
+                        self.is_recording_with_key63 = False
+                        self.stop_recording()
 
                 # Right Shift handling - check duration and discard or process
-                if key == Key.shift_r and self.shift_held:
+                elif key == Key.shift_r and self.shift_held:
                     hold_duration = time.time() - self.shift_press_time
                     self.shift_held = False
 
@@ -655,9 +881,16 @@ class WhisperDictationApp(rumps.App):
         self.stop_recording()
         sender.title = "Start Recording"
 
+    def _set_ui(self, title, status):
+        """Set the menu bar title and status line together, skipping writes that wouldn't change them"""
+        if self.title != title:
+            self.title = title
+        if self.status_item.title != status:
+            self.status_item.title = status
+
     def update_activity(self):
         """Update last activity timestamp"""
-        self.last_activity_time = time.time()
+        self.last_activity_time = time.monotonic()
 
     def read_selected_text_with_speed(self, speed):
         """Read selected text using TTS at specified speed"""
@@ -671,13 +904,20 @@ class WhisperDictationApp(rumps.App):
         self.tts_2x.title = "🔊 2.0x (Very Fast)" if speed == 2.0 else "2.0x (Very Fast)"
 
         # Run in background thread to avoid blocking UI
-        tts_thread = threading.Thread(target=self._read_selected_text_worker, args=(speed,))
-        tts_thread.start()
+        self._submit(self._read_selected_text_worker, speed)
 
     def stop_tts(self, sender=None):
         """Stop current TTS playback"""
         with self.audio_process_lock:
-            if self.current_audio_process and self.current_audio_process.poll() is None:
+            if self.current_audio_player is not None and self.current_audio_player.isPlaying():
+                logger.info("Stopping TTS playback...")
+                try:
+                    self.current_audio_player.stop()
+                    logger.info("✓ TTS playback stopped")
+                    self._set_ui("🎙️", "Status: Playback stopped")
+                except Exception as e:
+                    logger.error(f"Error stopping TTS: {e}")
+            elif self.current_audio_process and self.current_audio_process.poll() is None:
                 logger.info("Stopping TTS playback...")
                 try:
                     self.current_audio_process.terminate()
@@ -685,8 +925,7 @@ class WhisperDictationApp(rumps.App):
                     if self.current_audio_process.poll() is None:
                         self.current_audio_process.kill()
                     logger.info("✓ TTS playback stopped")
-                    self.title = "🎙️"
-                    self.status_item.title = "Status: Playback stopped"
+                    self._set_ui("🎙️", "Status: Playback stopped")
                 except Exception as e:
                     logger.error(f"Error stopping TTS: {e}")
             else:
@@ -721,53 +960,122 @@ class WhisperDictationApp(rumps.App):
 
             char_count = len(selected_text)
             logger.info(f"Reading aloud at {speed}x speed ({char_count} chars): {selected_text[:50]}...")
-            self.title = "🔊 (Reading...)"
-            self.status_item.title = f"Status: Reading at {speed}x speed..."
+            self._set_ui("🔊 (Reading...)", f"Status: Reading at {speed}x speed...")
 
             # Try TTS (OpenAI or macOS native fallback)
             try:
-                # Try text_to_speech without file output (will use macOS 'say' directly if OpenAI unavailable)
-                result = self.openai_client.text_to_speech(selected_text, output_path=None, speed=speed)
+                self._speak_text(selected_text, speed, char_count=char_count)
 
-                # If result is None, it means local TTS already played the audio
-                if result is None:
-                    logger.info("✓ Local TTS playback complete")
-                else:
-                    # OpenAI TTS returned audio data, save and play it
-                    with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_audio:
-                        audio_file = temp_audio.name
-                        temp_audio.write(result)
-
-                    # Play the audio file
-                    self._play_audio_file(audio_file, char_count=char_count)
-
-                    # Clean up
-                    try:
-                        os.unlink(audio_file)
-                    except Exception as e:
-                        logger.warning(f"Could not delete temp audio file: {e}")
-
-                self.title = "🎙️"
-                self.status_item.title = "Status: ✓ Finished reading"
+                self._set_ui("🎙️", "Status: ✓ Finished reading")
                 logger.info("✓ Finished reading text aloud")
 
             except Exception as e:
                 logger.error(f"TTS error: {e}")
-                self.title = "🎙️"
-                self.status_item.title = "Status: TTS unavailable"
+                self._set_ui("🎙️", "Status: TTS unavailable")
 
         except Exception as e:
             logger.error(f"Error reading text aloud: {e}")
-            self.title = "🎙️"
-            self.status_item.title = f"Status: TTS error - {str(e)[:30]}"
+            self._set_ui("🎙️", f"Status: TTS error - {str(e)[:30]}")
+
+    def _tts_cache_path(self, text, voice, rate):
+        """Cache file for rendered TTS audio of this text with this 'say' voice and rate"""
+        key = f"{voice}|{rate}|{text}".encode('utf-8')
+        digest = hashlib.blake2b(key, digest_size=16).hexdigest()
+        return self.tts_cache_dir / f"{digest}.wav"
+
+    def _evict_tts_cache(self):
+        """Drop least recently used cache entries until the cache fits its size limit"""
+        try:
+            entries = [(p, p.stat()) for p in self.tts_cache_dir.glob('*.wav')]
+            total = sum(st.st_size for _, st in entries)
+            if total <= self.tts_cache_max_bytes:
+                return
+            for path, st in sorted(entries, key=lambda e: e[1].st_mtime):
+                path.unlink(missing_ok=True)
+                total -= st.st_size
+                if total <= self.tts_cache_max_bytes:
+                    break
+        except Exception as e:
+            logger.debug(f"Error evicting TTS cache: {e}")
+
+    def _render_tts(self, text, speed):
+        """
+        Return the cached audio file for text at this speed, rendering it on a cache miss.
+
+        Returns:
+            Path: Rendered audio file in the TTS cache
+        """
+        # Key on exactly what 'say' renders with, so a changed system voice misses the cache
+        voice = self.openai_client.say_voice_name()
+        cache_path = self._tts_cache_path(text, voice, self.openai_client.say_rate(speed))
+
+        if cache_path.exists():
+            logger.debug(f"TTS cache hit: {cache_path.name}")
+            os.utime(cache_path)  # Mark as recently used for LRU eviction
+        else:
+            self.tts_cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.{threading.get_ident()}.tmp.wav")
+            rendered = self.openai_client.text_to_speech(text, output_path=str(temp_path), speed=speed, voice=voice)
+            os.replace(rendered, cache_path)
+            self._evict_tts_cache()
+
+        return cache_path
+
+    def _speak_text(self, text, speed, char_count=None):
+        """
+        Speak text aloud, reusing previously rendered audio for the same text/voice/speed.
+        The whole text is rendered in one synthesis call, so playback has no gaps between
+        sentences and a repeated read-aloud is a single cache hit.
+        """
+        self._play_audio_file(str(self._render_tts(text, speed)), char_count=char_count)
+
+    def _play_with_avaudioplayer(self, audio_file, timeout_seconds):
+        """
+        Play audio in-process with AVAudioPlayer (no player process to spawn).
+        Blocks until playback finishes, is stopped, or times out.
+
+        Returns:
+            bool: True if the file was played, False if AVAudioPlayer could not play it
+        """
+        url = NSURL.fileURLWithPath_(audio_file)
+        player, error = AVAudioPlayer.alloc().initWithContentsOfURL_error_(url, None)
+        if player is None:
+            logger.debug(f"AVAudioPlayer could not open audio: {error}")
+            return False
+
+        with self.audio_process_lock:
+            self.current_audio_player = player
+
+        # Show stop button
+        self.stop_tts_menu_item.title = "⏹ Stop Reading"
+        try:
+            if not player.play():
+                logger.debug("AVAudioPlayer failed to start playback")
+                return False
+
+            deadline = time.time() + timeout_seconds
+            while player.isPlaying() and time.time() < deadline:
+                time.sleep(0.05)
+
+            if player.isPlaying():
+                player.stop()
+                logger.warning(f"AVAudioPlayer timed out after {timeout_seconds}s")
+            else:
+                logger.info("✓ Audio played successfully with AVAudioPlayer")
+            return True
+        finally:
+            with self.audio_process_lock:
+                self.current_audio_player = None
+            # Hide stop button
+            self.stop_tts_menu_item.title = None
 
     def _play_audio_file(self, audio_file, char_count=None):
         """
         Play audio file with multiple fallback options.
-        Tries: afplay, mpg123, ffplay (in order)
+        Tries: in-process AVAudioPlayer, then afplay, mpg123, ffplay (in order)
 
         Args:
-            audio_file: Path to MP3 file
+            audio_file: Path to audio file
             char_count: Number of characters in the text (for timeout estimation)
         """
         logger.info(f"Playing audio: {audio_file}")
@@ -795,24 +1103,22 @@ class WhisperDictationApp(rumps.App):
             timeout_seconds = int(max(30, min(300, estimated_duration)))
             logger.debug(f"Timeout set to {timeout_seconds}s (based on file size)")
 
-        # Try multiple audio players in order of preference
-        players = [
-            ('afplay', ['afplay', audio_file]),
-            ('mpg123', ['mpg123', '-q', audio_file]),
-            ('ffplay', ['ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet', audio_file])
-        ]
-
-        last_error = None
-        for player_name, command in players:
+        # Prefer in-process playback: no fork/exec or `which` probe per TTS
+        if AVAUDIOPLAYER_AVAILABLE:
             try:
-                # Check if player is available
-                check_cmd = ['which', player_name]
-                result = subprocess.run(check_cmd, capture_output=True, text=True, timeout=2)
+                if self._play_with_avaudioplayer(audio_file, timeout_seconds):
+                    return
+            except Exception as e:
+                logger.warning(f"AVAudioPlayer error: {e}, falling back to external players")
 
-                if result.returncode != 0:
-                    logger.debug(f"{player_name} not available, trying next...")
-                    continue
+        # Try installed audio players in order of preference
+        if not _AUDIO_PLAYERS:
+            logger.debug("No external audio players (afplay, mpg123, ffplay) found on PATH")
 
+        last_error = "no audio player available"
+        for player_name, command_prefix in _AUDIO_PLAYERS:
+            command = command_prefix + [audio_file]
+            try:
                 logger.info(f"Using {player_name} to play audio")
 
                 # Show stop button
@@ -820,20 +1126,19 @@ class WhisperDictationApp(rumps.App):
 
                 # Try to play the audio with dynamic timeout
                 with self.audio_process_lock:
+                    # Players' output is discarded: no pipes to drain, and a chatty player can't stall on a full pipe
                     self.current_audio_process = subprocess.Popen(
                         command,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL
                     )
 
                 # Wait for playback to finish (with timeout)
                 try:
-                    stdout, stderr = self.current_audio_process.communicate(timeout=timeout_seconds)
-                    exit_code = self.current_audio_process.returncode
+                    exit_code = self.current_audio_process.wait(timeout=timeout_seconds)
 
                     if exit_code != 0:
-                        raise subprocess.CalledProcessError(exit_code, command, stdout, stderr)
+                        raise subprocess.CalledProcessError(exit_code, command)
 
                     logger.info(f"✓ Audio played successfully with {player_name}")
 
@@ -854,10 +1159,8 @@ class WhisperDictationApp(rumps.App):
                 logger.warning(f"{player_name} timed out, trying next player...")
                 continue
             except subprocess.CalledProcessError as e:
-                last_error = f"{player_name} failed: {e.stderr if e.stderr else e}"
+                last_error = f"{player_name} failed: {e}"
                 logger.warning(f"{player_name} failed (exit code {e.returncode})")
-                if e.stderr:
-                    logger.debug(f"  Error output: {e.stderr}")
                 continue
             except Exception as e:
                 last_error = f"{player_name} error: {e}"
@@ -879,34 +1182,54 @@ class WhisperDictationApp(rumps.App):
                 self.status_item.title = "Status: Waiting for MLX model to load"
                 return
         elif not self.openai_client.use_openai_whisper:
-            if not hasattr(self, 'model') or self.model is None:
+            if self.model is None:
                 logger.warning("Model not loaded. Please wait for the model to finish loading.")
                 self.status_item.title = "Status: Waiting for model to load"
                 return
 
+        # Audio init normally finishes long before the first press; wait briefly if it hasn't
+        if not self.audio_ready.wait(timeout=5.0) or self.audio is None:
+            logger.warning("Audio input not ready - cannot start recording")
+            self.status_item.title = "Status: Microphone not ready"
+            return
+
         self.update_activity()  # Update activity timestamp
-        self.frames = []
+        self.write_idx = 0
         self.recording = True
         self.recording_start_time = time.time()  # Track when recording started
         self.cached_selected_text = None  # Clear any previous cached selection
 
         # Update UI
-        self.title = "🎙️ (Recording)"
-        self.status_item.title = "Status: Recording..."
+        self._set_ui("🎙️ (Recording)", "Status: Recording...")
 
         # Show recording indicator
         self.indicator.start()
 
-        # Start recording thread
-        self.recording_thread = threading.Thread(target=self.record_audio)
-        self.recording_thread.start()
+        # Resume the persistent input stream; samples arrive via _on_audio
+        try:
+            if self.stream is None:
+                self._open_stream()
+            self.stream.start_stream()
+        except Exception as e:
+            logger.error(f"Error starting audio stream: {e}")
+            self.recording = False
+            self.recording_start_time = None
+            self.indicator.stop()
+            self._set_ui("🎙️", "Status: Error starting microphone")
+            return
+
+        # Auto-stop once the maximum recording duration is reached
+        self._cancel_max_duration_timer()
+        self.max_duration_timer = threading.Timer(self.max_recording_duration, self._auto_stop_recording)
+        self.max_duration_timer.daemon = True
+        self.max_duration_timer.start()
     
     def stop_recording(self):
         self.update_activity()  # Update activity timestamp
         self.recording = False
         self.recording_start_time = None  # Clear recording start time
-        if hasattr(self, 'recording_thread'):
-            self.recording_thread.join(timeout=2.0)  # Add timeout to prevent indefinite blocking
+        self._cancel_max_duration_timer()
+        self._pause_stream()
 
         # Hide recording indicator
         self.indicator.stop()
@@ -916,15 +1239,12 @@ class WhisperDictationApp(rumps.App):
 
         if self.cached_selected_text:
             logger.debug(f"Selected text captured ({len(self.cached_selected_text)} chars)")
-            self.title = "🎙️ (AI Enhancing)"
-            self.status_item.title = "Status: AI enhancing..."
+            self._set_ui("🎙️ (AI Enhancing)", "Status: AI enhancing...")
         else:
-            self.title = "🎙️ (Transcribing)"
-            self.status_item.title = "Status: Transcribing..."
+            self._set_ui("🎙️ (Transcribing)", "Status: Transcribing...")
 
         # Process in background
-        transcribe_thread = threading.Thread(target=self.process_recording)
-        transcribe_thread.start()
+        self._submit(self.process_recording)
     
     def process_recording(self):
         # Transcribe and insert text
@@ -936,84 +1256,140 @@ class WhisperDictationApp(rumps.App):
         finally:
             self.title = "🎙️"  # Reset title
     
-    def record_audio(self):
-        stream = None
+    def _level_worker(self):
+        """Background thread: feed captured chunks to the recording indicator"""
+        while True:
+            in_data = self.level_queue.get()
+            self.indicator.update_audio_level(in_data)
+
+    def _on_audio(self, in_data, frame_count, time_info, status):
+        """PyAudio stream callback: copy captured samples into the preallocated buffer"""
+        samples = np.frombuffer(in_data, dtype=np.int16)
+        start = self.write_idx
+        end = min(start + len(samples), len(self.audio_buf))
+        self.audio_buf[start:end] = samples[:end - start]
+        self.write_idx = end
+
+        # Hand the chunk to the level thread; if it's still busy with the previous one, skip this one
         try:
-            # Build kwargs for audio stream
-            stream_kwargs = {
-                'format': self.format,
-                'channels': self.channels,
-                'rate': self.rate,
-                'input': True,
-                'frames_per_buffer': self.chunk
-            }
-            # Use selected input device if specified
-            if self.selected_input_device is not None:
-                stream_kwargs['input_device_index'] = self.selected_input_device
-
-            stream = self.audio.open(**stream_kwargs)
-
-            while self.recording:
-                try:
-                    data = stream.read(self.chunk, exception_on_overflow=False)
-                    self.frames.append(data)
-
-                    # Update indicator with audio level
-                    self.indicator.update_audio_level(data)
-                except Exception as e:
-                    logger.error(f"Error reading audio chunk: {e}")
-                    break
+            self.level_queue.put_nowait(in_data)
+        except queue.Full:
+            pass
+
+        if end >= len(self.audio_buf):
+            return (None, pyaudio.paComplete)
+        return (None, pyaudio.paContinue)
+
+    def _open_stream(self):
+        """Open a stopped input stream on the selected device, replacing any existing one"""
+        self._close_stream()
+        # Build kwargs for audio stream
+        stream_kwargs = {
+            'format': self.format,
+            'channels': self.channels,
+            'rate': self.rate,
+            'input': True,
+            'frames_per_buffer': self.chunk,
+            'stream_callback': self._on_audio,
+            'start': False
+        }
+        # Use selected input device if specified
+        if self.selected_input_device is not None:
+            stream_kwargs['input_device_index'] = self.selected_input_device
+
+        self.stream = self.audio.open(**stream_kwargs)
+
+    def _pause_stream(self):
+        """Stop capturing but keep the stream open for the next recording"""
+        if self.stream is None:
+            return
+        try:
+            self.stream.stop_stream()
+        except Exception as e:
+            logger.error(f"Error stopping audio stream: {e}")
 
+    def _close_stream(self):
+        """Stop and close the input stream, if open"""
+        stream, self.stream = self.stream, None
+        if stream is None:
+            return
+        try:
+            stream.stop_stream()
+            stream.close()
         except Exception as e:
-            logger.error(f"Error in record_audio: {e}")
-            self.recording = False
-        finally:
-            if stream:
-                try:
-                    stream.stop_stream()
-                    stream.close()
-                except Exception as e:
-                    logger.error(f"Error closing audio stream: {e}")
+            logger.error(f"Error closing audio stream: {e}")
     
+    def _write_wav(self, target, sample_count):
+        """
+        Write the first sample_count captured samples as a WAV file.
+        Only the two size fields of the precomputed header change per recording.
+
+        Args:
+            target: File path or writable binary file object
+            sample_count: Number of samples from audio_buf to write
+        """
+        pcm = memoryview(self.audio_buf[:sample_count]).cast('B')
+        header = bytearray(self.wav_header)
+        struct.pack_into('<I', header, 4, 36 + len(pcm))  # RIFF chunk size
+        struct.pack_into('<I', header, 40, len(pcm))      # data chunk size
+
+        if isinstance(target, str):
+            with open(target, 'wb') as f:
+                f.write(header)
+                f.write(pcm)
+        else:
+            target.write(header)
+            target.write(pcm)
+
     def transcribe_audio(self):
-        if not self.frames:
-            self.title = "🎙️"
-            self.status_item.title = "Status: No audio recorded"
+        sample_count = self.write_idx
+        if sample_count == 0:
+            self._set_ui("🎙️", "Status: No audio recorded")
             logger.warning("No audio recorded")
             return
 
-        # Save the recorded audio to a temporary file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-            temp_filename = temp_file.name
-
-        with wave.open(temp_filename, 'wb') as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(self.audio.get_sample_size(self.format))
-            wf.setframerate(self.rate)
-            wf.writeframes(b''.join(self.frames))
-
-        logger.debug("Audio saved to temporary file. Transcribing...")
-
         # Transcribe with Whisper (MLX, faster-whisper, or OpenAI API)
         # All modes auto-detect language and translate to English
         try:
             # Check transcription backend priority
             if self.use_mlx_whisper and self.mlx_client:
                 logger.debug("Using MLX Whisper (auto-detect → English)...")
-                text = self.mlx_client.transcribe_audio(temp_filename)
+                # Capture is already 16 kHz mono, so hand MLX the samples directly:
+                # no WAV written to disk and no ffmpeg decode/resample inside mlx_whisper
+                with self.float_scratch_lock:
+                    audio = self.float_scratch[:sample_count]
+                    pcm16_to_float32(self.audio_buf[:sample_count], audio)
+                    text = self.mlx_client.transcribe_audio(audio)
             elif self.openai_client.is_available() and self.openai_client.use_openai_whisper:
+                # Upload straight from memory - no WAV file on disk
+                wav_bytes = io.BytesIO()
+                self._write_wav(wav_bytes, sample_count)
+
                 logger.debug("Using OpenAI Whisper API (auto-detect → English)...")
-                text = self.openai_client.transcribe_audio(temp_filename)
+                text = self.openai_client.transcribe_audio_bytes(wav_bytes.getvalue())
             else:
                 # Use local faster-whisper model with translation to English
                 logger.debug("Using faster-whisper model (auto-detect → English)...")
                 try:
-                    # task="translate" auto-detects language and translates to English
-                    segments, _ = self.model.transcribe(temp_filename, beam_size=5, task="translate")
+                    # Held until the segment generator is drained, since it reads from the scratch buffer
+                    with self.float_scratch_lock:
+                        # Feed the captured samples directly as float32 instead of re-decoding the WAV,
+                        # scaling in one vectorized pass into the preallocated scratch buffer
+                        audio = self.float_scratch[:sample_count]
+                        pcm16_to_float32(self.audio_buf[:sample_count], audio)
+
+                        # task="translate" auto-detects language and translates to English
+                        # Batched inference only pays off past one 30s window; short clips stay sequential
+                        duration = sample_count / self.rate
+                        if self.batched_model is not None and duration >= 30:
+                            segments, _ = self.batched_model.transcribe(
+                                audio, batch_size=8, vad_filter=True, task="translate"
+                            )
+                        else:
+                            segments, _ = self.model.transcribe(audio, beam_size=5, task="translate")
 
-                    text = ""
-                    for segment in segments:
-                        text += segment.text
+                        # Drains the segment generator; one join instead of growing a string per segment
+                        text = "".join(segment.text for segment in segments)
                 except Exception as model_error:
                     logger.error(f"Error with Whisper model transcription: {model_error}")
                     raise Exception(f"Whisper model error: {model_error}")
@@ -1022,29 +1398,21 @@ class WhisperDictationApp(rumps.App):
                 text_lower = text.strip().lower()
 
                 # Check for task commands FIRST (before selected text)
-                task_keywords = ['task', 'todo', 'to do']
-                is_task_command = any(text_lower.startswith(keyword) for keyword in task_keywords)
-
-                if is_task_command:
+                if text_lower.startswith(self.TASK_PREFIXES):
                     logger.info(f"Task command detected: {text}")
-                    self.title = "🎙️ (Processing task...)"
-                    self.status_item.title = "Status: Processing task command..."
+                    self._set_ui("🎙️ (Processing task...)", "Status: Processing task command...")
                     self.process_task_command(text)
                     return  # Don't proceed to normal dictation
 
                 # Use cached selected text (captured when recording stopped)
-                selected_text = getattr(self, 'cached_selected_text', None)
+                selected_text = self.cached_selected_text
 
                 if selected_text and self.openai_client.is_available():
                     logger.info(f"Selected text detected: {selected_text[:50]}...")
                     logger.info(f"Voice instruction: {text}")
 
                     # Check if this is a TTS request
-                    tts_keywords = ['read', 'speak', 'say']
-                    instruction_lower = text.strip().lower()
-                    is_tts_request = any(keyword in instruction_lower for keyword in tts_keywords)
-
-                    if is_tts_request:
+                    if self.TTS_REQUEST_RE.search(text_lower):
                         # TTS mode - read the selected text aloud
                         logger.info("Detected TTS request - reading text aloud")
 
@@ -1057,38 +1425,16 @@ class WhisperDictationApp(rumps.App):
                         char_count = len(selected_text)
 
                         try:
-                            self.title = "🔊 (Reading...)"
-                            self.status_item.title = f"Status: Reading at {self.tts_speed}x speed..."
-
-                            # Try text_to_speech (OpenAI or macOS native fallback)
-                            result = self.openai_client.text_to_speech(selected_text, output_path=None, speed=self.tts_speed)
-
-                            # If result is None, local TTS already played the audio
-                            if result is None:
-                                logger.info("✓ Local TTS playback complete")
-                            else:
-                                # OpenAI TTS returned audio data, save and play it
-                                with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_audio:
-                                    audio_file = temp_audio.name
-                                    temp_audio.write(result)
-
-                                # Play the audio file
-                                self._play_audio_file(audio_file, char_count=char_count)
-
-                                # Clean up
-                                try:
-                                    os.unlink(audio_file)
-                                except Exception as e:
-                                    logger.warning(f"Could not delete temp audio file: {e}")
-
-                            self.title = "🎙️"
-                            self.status_item.title = "Status: ✓ Finished reading"
+                            self._set_ui("🔊 (Reading...)", f"Status: Reading at {self.tts_speed}x speed...")
+
+                            self._speak_text(selected_text, self.tts_speed, char_count=char_count)
+
+                            self._set_ui("🎙️", "Status: ✓ Finished reading")
                             logger.info("✓ Finished reading text aloud")
 
                         except Exception as e:
                             logger.error(f"Error with TTS: {e}")
-                            self.title = "🎙️"
-                            self.status_item.title = f"Status: TTS error"
+                            self._set_ui("🎙️", f"Status: TTS error")
 
                     else:
                         # AI Enhancement mode - modify the text
@@ -1103,20 +1449,34 @@ class WhisperDictationApp(rumps.App):
                         if selected_text:
                             try:
                                 # Use OpenAI to enhance the selected text
-                                self.title = "🎙️ (Calling AI...)"
-                                self.status_item.title = "Status: Calling AI..."
-                                enhanced_text = self.openai_client.enhance_text(text, selected_text)
+                                self._set_ui("🎙️ (Calling AI...)", "Status: Calling AI...")
+                                # Stream the response so the status shows progress from the first token;
+                                # the selection is still replaced once, with the complete text
+                                pieces = []
+                                received = 0
+                                for piece in self.openai_client.enhance_text_stream(text, selected_text):
+                                    pieces.append(piece)
+                                    received += len(piece)
+                                    if len(pieces) % 16 == 1:
+                                        self._set_ui("🎙️ (AI writing...)", f"Status: AI writing... ({received} chars)")
+                                enhanced_text = "".join(pieces).strip()
+                                if not enhanced_text:
+                                    raise Exception("No content in OpenAI response")
+                                logger.info("✓ Text enhancement successful")
 
                                 # Replace selected text with enhanced version
-                                self.title = "🎙️ (Replacing...)"
-                                self.status_item.title = "Status: Replacing text..."
+                                self._set_ui("🎙️ (Replacing...)", "Status: Replacing text...")
 
-                                # Pass original text so it can find and replace it
+                                # Pastes over the still-active selection; original text is for logging
                                 self.text_selector.replace_selected_text(enhanced_text, original_text=selected_text)
 
                                 logger.info(f"✓ Enhanced: {enhanced_text}")
-                                self.title = "🎙️"
-                                self.status_item.title = f"Status: ✓ Enhanced"
+                                self._set_ui("🎙️", f"Status: ✓ Enhanced")
+
+                            except EnhancementTruncated:
+                                # A partial edit would silently drop the end of the user's text
+                                logger.warning("⚠️  AI response was cut off - leaving the selected text unchanged")
+                                self._set_ui("🎙️", "Status: AI response too long - text unchanged")
 
                             except Exception as e:
                                 logger.error(f"Error enhancing text: {e}")
@@ -1142,48 +1502,90 @@ class WhisperDictationApp(rumps.App):
             logger.error(f"Transcription error: {e}")
             self.status_item.title = "Status: Transcription error"
             raise
-        finally:
-            # Clean up the temporary file
-            os.unlink(temp_filename)
     
-    def insert_text(self, text):
-        # Paste text using clipboard + Cmd+V (works in any focused app)
+    def _insert_via_keystroke(self, text):
+        """
+        Type text directly into the focused app with System Events keystrokes.
+        Fallback for insert_text when pasting fails: it needs its own Automation
+        permission for System Events, and it mistypes non-ASCII text and characters
+        on non-US keyboard layouts, so callers only pass it plain ASCII.
+
+        Returns:
+            bool: True if the text was typed, False if the caller should fall back further
+        """
+        # json.dumps yields a double-quoted literal whose escapes AppleScript also understands
+        script = f'tell application "System Events" to keystroke {json.dumps(text)}'
         try:
-            import pyperclip
+            subprocess.run(['osascript', '-e', script], check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
+            return True
+        except Exception as e:
+            logger.debug(f"Keystroke insertion failed: {e}")
+            return False
 
-            # Save current clipboard
-            original_clipboard = pyperclip.paste()
+    def insert_text(self, text):
+        # The save/copy/paste/restore sequence must not interleave with TextSelection's own
+        # pasteboard sequences (e.g. get_selected_text on another worker)
+        with _PASTEBOARD_LOCK:
+            # Paste text using clipboard + Cmd+V (works in any focused app)
+            pasted = False
+            try:
+                import pyperclip
 
-            # Copy text to clipboard
-            pyperclip.copy(text)
+                # Save current clipboard
+                original_clipboard = pyperclip.paste()
 
-            # Small delay to ensure clipboard is updated
-            time.sleep(0.1)
+                # Copy text to clipboard
+                pyperclip.copy(text)
 
-            # Send Cmd+V to paste using pynput (requires accessibility permissions)
-            self.keyboard_controller.press(Key.cmd)
-            time.sleep(0.05)
-            self.keyboard_controller.press('v')
-            time.sleep(0.05)
-            self.keyboard_controller.release('v')
-            time.sleep(0.05)
-            self.keyboard_controller.release(Key.cmd)
+                # Small delay to ensure clipboard is updated
+                time.sleep(0.1)
 
-            # Restore original clipboard after a delay
-            time.sleep(0.1)
-            pyperclip.copy(original_clipboard)
+                # Send Cmd+V to paste using pynput (requires accessibility permissions)
+                self.keyboard_controller.press(Key.cmd)
+                time.sleep(0.05)
+                self.keyboard_controller.press('v')
+                time.sleep(0.05)
+                self.keyboard_controller.release('v')
+                time.sleep(0.05)
+                self.keyboard_controller.release(Key.cmd)
+                pasted = True
 
-        except Exception as e:
-            logger.error(f"Error inserting text: {e}")
-            # Final fallback: just copy to clipboard
-            import pyperclip
-            pyperclip.copy(text)
-            logger.info("Text copied to clipboard - paste with Cmd+V")
+                # Restore original clipboard once the target app has had time to read it
+                time.sleep(PASTE_SETTLE)
+                pyperclip.copy(original_clipboard)
+
+            except Exception as e:
+                logger.error(f"Error inserting text: {e}")
+                if pasted:
+                    return
+                # Plain ASCII can still be typed with System Events keystrokes
+                if text.isascii() and text.isprintable() and self._insert_via_keystroke(text):
+                    return
+                # Final fallback: just copy to clipboard
+                import pyperclip
+                pyperclip.copy(text)
+                logger.info("Text copied to clipboard - paste with Cmd+V")
 
     def setup_task_menu(self):
         """Setup/refresh task submenu with current tasks"""
+        # Dynamic task items (top 10 pending only)
+        tasks = self.task_manager.get_tasks(limit=10, status='pending')
+        pending_count = self.task_manager.get_pending_count()
+
+        # Everything the item titles and callbacks depend on (friendly dates depend on today's date)
+        today = datetime.now().date()
+        state = (today, [
+            (t['id'], t['status'], t['description'][:30], t['priority'], t['due_date']) for t in tasks
+        ])
+        if self.task_submenu is not None and state == self.task_menu_state:
+            # Items are unchanged - skip rebuilding them, just refresh the count
+            self.task_submenu.title = f"Tasks ({pending_count} pending)"
+            return
+        self.task_menu_state = state
+
         # Create submenu if it doesn't exist, otherwise clear it
-        if not hasattr(self, 'task_submenu'):
+        if self.task_submenu is None:
             self.task_submenu = rumps.MenuItem("Tasks")
         elif hasattr(self.task_submenu, '_menu') and self.task_submenu._menu is not None:
             self.task_submenu.clear()
@@ -1196,13 +1598,10 @@ class WhisperDictationApp(rumps.App):
         self.task_submenu.add(list_item)
         self.task_submenu.add(rumps.separator)
 
-        # Dynamic task items (top 10 pending only)
-        tasks = self.task_manager.get_tasks(limit=10, status='pending')
-
         for task in tasks:
             icon = "[ ]" if task['status'] == 'pending' else "[✓]"
             priority_label = f"({task['priority'].title()})" if task['priority'] else ""
-            due_label = f"- {self.format_friendly_date(task['due_date'])}" if task['due_date'] else ""
+            due_label = f"- {self.format_friendly_date(task['due_date'], today)}" if task['due_date'] else ""
 
             title = f"{icon} {task['description'][:30]} {priority_label} {due_label}"
             menu_item = rumps.MenuItem(title, callback=lambda s, t=task: self.toggle_task_from_menu(t))
@@ -1216,7 +1615,6 @@ class WhisperDictationApp(rumps.App):
         self.task_submenu.add(view_item)
 
         # Update menu title with count
-        pending_count = self.task_manager.get_pending_count()
         self.task_submenu.title = f"Tasks ({pending_count} pending)"
 
     def process_task_command(self, text):
@@ -1228,8 +1626,7 @@ class WhisperDictationApp(rumps.App):
 
             if not parsed or 'action' not in parsed:
                 logger.warning("Could not parse task command")
-                self.status_item.title = "Status: Could not understand task command"
-                self.title = "🎙️"
+                self._set_ui("🎙️", "Status: Could not understand task command")
                 return
 
             # Execute action
@@ -1274,8 +1671,7 @@ class WhisperDictationApp(rumps.App):
 
         except Exception as e:
             logger.error(f"Error processing task command: {e}")
-            self.status_item.title = f"Status: Task error"
-            self.title = "🎙️"
+            self._set_ui("🎙️", f"Status: Task error")
 
     def speak_feedback(self, message):
         """Speak feedback using TTS (OpenAI or macOS native fallback)"""
@@ -1283,24 +1679,8 @@ class WhisperDictationApp(rumps.App):
             self.title = "🔊"
             logger.info(f"Speaking: {message}")
 
-            # Try text_to_speech (OpenAI or macOS native fallback) - use current speed setting
-            result = self.openai_client.text_to_speech(message, output_path=None, speed=self.tts_speed)
-
-            # If result is None, local TTS already played the audio
-            if result is None:
-                logger.info("✓ Local TTS playback complete")
-            else:
-                # OpenAI TTS returned audio data, save and play it
-                with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_audio:
-                    audio_file = temp_audio.name
-                    temp_audio.write(result)
-
-                self._play_audio_file(audio_file)
-
-                try:
-                    os.unlink(audio_file)
-                except Exception as e:
-                    logger.warning(f"Could not delete temp audio file: {e}")
+            # Use current speed setting
+            self._speak_text(message, self.tts_speed)
 
             self.title = "🎙️"
         except Exception as e:
@@ -1325,13 +1705,14 @@ class WhisperDictationApp(rumps.App):
 
         count = len(tasks)
         feedback = f"You have {count} pending task{'s' if count > 1 else ''}. "
+        today = datetime.now().date()
 
         for i, task in enumerate(tasks[:5], 1):  # Limit to 5 for voice
             feedback += f"{i}. {task['description']}"
             if task.get('priority'):
                 feedback += f", {task['priority']} priority"
             if task.get('due_date'):
-                feedback += f", due {self.format_friendly_date(task['due_date'])}"
+                feedback += f", due {self.format_friendly_date(task['due_date'], today)}"
             feedback += ". "
 
         if count > 5:
@@ -1339,15 +1720,21 @@ class WhisperDictationApp(rumps.App):
 
         return feedback
 
-    def format_friendly_date(self, date_str):
-        """Convert ISO date to friendly format (e.g., 'tomorrow', 'today')"""
+    def format_friendly_date(self, date_str, today=None):
+        """
+        Convert ISO date to friendly format (e.g., 'tomorrow', 'today')
+
+        Args:
+            date_str: ISO date string (YYYY-MM-DD)
+            today: Current date, so callers formatting many dates compute it once (defaults to now)
+        """
         if not date_str:
             return ""
 
         try:
-            from datetime import datetime, timedelta
             task_date = datetime.fromisoformat(date_str).date()
-            today = datetime.now().date()
+            if today is None:
+                today = datetime.now().date()
             tomorrow = today + timedelta(days=1)
 
             if task_date == today:
@@ -1381,8 +1768,6 @@ class WhisperDictationApp(rumps.App):
 
     def prompt_task_typing(self, sender):
         """Open text input window for typing task using native AppKit dialog"""
-        from AppKit import NSTextField, NSMakeRect
-
         # Create alert
         alert = NSAlert.alloc().init()
         alert.setMessageText_("Add Task")
@@ -1410,7 +1795,7 @@ class WhisperDictationApp(rumps.App):
                     task_text = f"task add {task_text}"
                 logger.info(f"Processing typed task command: {task_text}")
                 # Process the task command
-                threading.Thread(target=self._process_typed_task, args=(task_text,)).start()
+                self._submit(self._process_typed_task, task_text)
             else:
                 logger.warning("Empty task text - ignoring")
 
@@ -1482,7 +1867,11 @@ class WhisperDictationApp(rumps.App):
     def open_task_file(self, sender):
         """Open task JSON file in default editor"""
         try:
-            subprocess.run(['open', str(self.task_manager.task_file)])
+            # Fold pending mutations into the JSON file so the editor shows every task
+            self.task_manager.compact()
+            # In-process LaunchServices call instead of spawning /usr/bin/open
+            if not NSWorkspace.sharedWorkspace().openFile_(str(self.task_manager.task_file)):
+                logger.error(f"Could not open task file: {self.task_manager.task_file}")
         except Exception as e:
             logger.error(f"Error opening task file: {e}")
 
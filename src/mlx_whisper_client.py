@@ -1,56 +1,184 @@
 #!/usr/bin/env python3
 # ABOUTME: MLX Whisper client for local speech-to-text on Apple Silicon Macs
 # ABOUTME: Optimized for M1/M2/M3 with auto-detection and English translation
+import functools
+import importlib.util
 import os
-import tempfile
+import re
+import subprocess
 import ssl
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from logger_config import setup_logging
 
 logger = setup_logging()
 
+# Non-Latin scripts (Hindi, Arabic, Chinese, Japanese, Korean) that mark text as not English
+_NON_LATIN_RE = re.compile(
+    '['
+    '\u0900-\u097F'  # Devanagari (Hindi)
+    '\u0600-\u06FF'  # Arabic
+    '\u4E00-\u9FFF'  # CJK Unified Ideographs (Chinese)
+    '\u3040-\u309F'  # Hiragana (Japanese)
+    '\u30A0-\u30FF'  # Katakana (Japanese)
+    '\uAC00-\uD7AF'  # Hangul (Korean)
+    ']'
+)
+
+# transformers.pipeline, imported on first local translation (heavy import, rarely needed)
+_translation_pipeline = None
+
+# Seconds to wait for a translation pipeline to build before falling back to OpenAI
+_TRANSLATOR_LOAD_TIMEOUT = 10
+
+# Single worker that builds translation pipelines, so the load timeout works from any thread.
+# Replaced after a timeout, so the next load doesn't queue behind the build still running
+_translator_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='translator-load')
+
+# Hugging Face cache locations, resolved once (expanduser does a HOME/pwd lookup)
+HF_HOME_DIR = os.path.expanduser('~/.cache/huggingface')
+HF_CACHE_DIR = os.path.join(HF_HOME_DIR, 'hub')
+
+# int8 CTranslate2 conversions of the translation models (written by setup_mlx_models.sh)
+CT2_MODELS_DIR = os.path.expanduser('~/.cache/whisper-dictation/ct2')
+
+@functools.cache
+def _performance_core_count():
+    """Number of performance cores (Apple Silicon), else half the logical CPUs.
+
+    Used to size CPU thread pools for translation (torch/CTranslate2): MLX Whisper
+    runs on the GPU, so sticking to P-cores keeps translation off the E-cores.
+    """
+    try:
+        result = subprocess.run(
+            ['sysctl', '-n', 'hw.perflevel0.physicalcpu'],
+            capture_output=True, text=True, timeout=2
+        )
+        cores = int(result.stdout.strip())
+        if cores > 0:
+            return cores
+    except (OSError, ValueError, subprocess.SubprocessError):
+        pass
+    return max(1, (os.cpu_count() or 2) // 2)
+
+def _get_translation_pipeline():
+    """Import transformers' pipeline factory once; offline mode must already be set in the environment"""
+    global _translation_pipeline
+    if _translation_pipeline is None:
+        from transformers import pipeline
+        _translation_pipeline = pipeline
+    return _translation_pipeline
+
+def _build_translator(model_name):
+    """Build the CTranslate2 or transformers translator for model_name (see _load_translator)"""
+    ct2_dir = os.path.join(CT2_MODELS_DIR, model_name.split('/')[-1])
+    if os.path.isfile(os.path.join(ct2_dir, "model.bin")) and importlib.util.find_spec("ctranslate2"):
+        logger.debug(f"Using CTranslate2 int8 translator: {ct2_dir}")
+        return CT2Translator(ct2_dir, model_name)
+    # Use CPU for compatibility, local_files_only=True prevents any network access
+    return _get_translation_pipeline()("translation", model=model_name, device=-1, local_files_only=True)
+
+class CT2Translator:
+    """CTranslate2 int8 translator with the same call interface as a transformers translation pipeline"""
+
+    def __init__(self, model_dir, model_name):
+        import ctranslate2
+        from transformers import AutoTokenizer
+
+        self.translator = ctranslate2.Translator(
+            model_dir, device="cpu", compute_type="int8", intra_threads=_performance_core_count()
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name, local_files_only=True)
+
+    def __call__(self, text, max_length=512):
+        tokens = self.tokenizer.convert_ids_to_tokens(self.tokenizer.encode(text))
+        output = self.translator.translate_batch([tokens], max_decoding_length=max_length)
+        target = output[0].hypotheses[0]
+        translated = self.tokenizer.decode(
+            self.tokenizer.convert_tokens_to_ids(target), skip_special_tokens=True
+        )
+        return [{"translation_text": translated}]
+
 class MLXWhisperClient:
     """MLX Whisper transcription client - optimized for Apple Silicon"""
 
+    # Map common names to MLX model paths
+    model_map = {
+        "tiny": "mlx-community/whisper-tiny-mlx",
+        "base": "mlx-community/whisper-base-mlx",
+        "small": "mlx-community/whisper-small-mlx",
+        "medium": "mlx-community/whisper-medium-mlx",
+        "large": "mlx-community/whisper-large-v3-mlx",
+        "large-v3": "mlx-community/whisper-large-v3-mlx",
+        # 4-bit quantized large-v3: ~1/3 the weight bandwidth of fp16, faster decoding
+        "large-v3-4bit": "mlx-community/whisper-large-v3-mlx-4bit",
+    }
+
+    # Approximate download size in MB per model
+    model_sizes_mb = {
+        "tiny": 39,
+        "base": 140,
+        "small": 244,
+        "medium": 769,
+        "large": 2900,
+        "large-v3": 2900,
+        "large-v3-4bit": 880,
+    }
+
+    # Map language codes to Helsinki-NLP translation model names
+    translation_models = {
+        "hi": "Helsinki-NLP/opus-mt-hi-en",    # Hindi to English
+        "ur": "Helsinki-NLP/opus-mt-ur-en",    # Urdu to English
+        "zh": "Helsinki-NLP/opus-mt-zh-en",    # Chinese to English
+    }
+
+    # Set once the SSL cert environment has been configured for this process
+    _ssl_configured = False
+
     def __init__(self, model_size="large-v3"):
         """
         Initialize MLX Whisper model
 
         Args:
-            model_size: Model size to use (tiny, base, small, medium, large-v3)
-                       Default: large-v3 (highest accuracy)
+            model_size: Model size to use (tiny, base, small, medium, large-v3, large-v3-4bit)
+                       Default: large-v3 (highest accuracy); large-v3-4bit trades a little
+                       accuracy for much faster inference
         """
         self.model_size = model_size
+        # Resolved once; every load/transcribe uses this repo id
+        self.model_repo = self.model_map.get(model_size, "mlx-community/whisper-large-v3-mlx")
         self.model = None
         self.processor = None
-
-        # Map common names to MLX model paths
-        self.model_map = {
-            "tiny": "mlx-community/whisper-tiny-mlx",
-            "base": "mlx-community/whisper-base-mlx",
-            "small": "mlx-community/whisper-small-mlx",
-            "medium": "mlx-community/whisper-medium-mlx",
-            "large": "mlx-community/whisper-large-v3-mlx",
-            "large-v3": "mlx-community/whisper-large-v3-mlx",
-        }
+        self.model_path = None  # Local snapshot directory, resolved on first use
+        # Translation model name -> whether its cache is valid (see refresh_cache_status)
+        self._translation_cache_status = {}
+        # Translation model name -> loaded transformers pipeline
+        self._translators = {}
+        # OpenAIClient for translation fallback, created on first use
+        self._openai_client = None
 
         self._load_model()
 
     def _load_model(self):
         """Load MLX Whisper model from Hugging Face"""
         try:
-            import os
-
-            model_name = self.model_map.get(self.model_size, "mlx-community/whisper-large-v3-mlx")
-            logger.info(f"Loading MLX Whisper model: {self.model_size} ({model_name})")
+            logger.info(f"Loading MLX Whisper model: {self.model_size} ({self.model_repo})")
 
             # Set HuggingFace cache dir
-            cache_dir = os.path.expanduser('~/.cache/huggingface/hub')
-            os.environ['HF_HOME'] = os.path.expanduser('~/.cache/huggingface')
+            cache_dir = HF_CACHE_DIR
+            os.environ['HF_HOME'] = HF_HOME_DIR
             os.environ['HF_HUB_DISABLE_TELEMETRY'] = '1'
 
             # CRITICAL: Set offline mode BEFORE importing mlx_whisper to prevent any network calls
-            # This must be set before huggingface_hub initializes its HTTP client
+            # This must be set before huggingface_hub initializes its HTTP client.
+            # Set once for the process; local translation (transformers) relies on it too.
             os.environ['HF_HUB_OFFLINE'] = '1'
+            os.environ['TRANSFORMERS_OFFLINE'] = '1'
+            os.environ['HUGGINGFACE_CO_OFFLINE'] = '1'
+
+            # Cap OpenMP/MKL pools (read when torch first loads) unless the user set them
+            cpu_threads = str(_performance_core_count())
+            os.environ.setdefault('OMP_NUM_THREADS', cpu_threads)
+            os.environ.setdefault('MKL_NUM_THREADS', cpu_threads)
 
             # Set SSL certs for Zscaler compatibility (for initial download if needed)
             self._setup_ssl_for_huggingface()
@@ -59,11 +187,12 @@ class MLXWhisperClient:
             import mlx_whisper
 
             # Check if model is already cached
-            model_repo = self.model_map.get(self.model_size, "mlx-community/whisper-large-v3-mlx")
-            cache_path = os.path.join(cache_dir, f"models--{model_repo.replace('/', '--')}")
+            cache_path = os.path.join(cache_dir, f"models--{self.model_repo.replace('/', '--')}")
 
             if os.path.exists(cache_path):
                 logger.info(f"✓ Model already cached at: {cache_path}")
+                self.mlx_whisper = mlx_whisper
+                self._preload_weights()
             else:
                 logger.info(f"📥 Downloading model (~{self._get_model_size()} MB)...")
                 logger.info(f"   Cache location: {cache_dir}")
@@ -80,10 +209,51 @@ class MLXWhisperClient:
             logger.error(f"Error loading MLX Whisper model: {e}")
             raise
 
+    def _resolve_model_path(self):
+        """
+        Find the cached snapshot directory for the model and remember it in self.model_path.
+
+        Returns:
+            str: Local snapshot path (HF cache structure: models--*/snapshots/<hash>/)
+        """
+        cache_model_dir = os.path.join(HF_CACHE_DIR, f"models--{self.model_repo.replace('/', '--')}")
+
+        snapshots_dir = os.path.join(cache_model_dir, "snapshots")
+        if not os.path.exists(snapshots_dir):
+            raise FileNotFoundError(f"Model not cached. Run: ./setup_mlx_models.sh")
+
+        # Get the first (and usually only) snapshot hash
+        snapshot_dirs = os.listdir(snapshots_dir)
+        if not snapshot_dirs:
+            raise FileNotFoundError(f"No snapshots found in {snapshots_dir}")
+
+        self.model_path = os.path.join(snapshots_dir, snapshot_dirs[0])
+        logger.debug(f"Using cached model at: {self.model_path}")
+        return self.model_path
+
+    def _preload_weights(self):
+        """
+        Load the model into mlx_whisper's model cache and materialize its weights now,
+        so the first transcription doesn't pay for loading. Best effort: on failure the
+        model is simply loaded by the first transcribe() call instead.
+        """
+        try:
+            import mlx.core as mx
+            from mlx_whisper.transcribe import ModelHolder
+
+            # transcribe() is called with fp16=True, and ModelHolder reuses the model for the same path
+            model = ModelHolder.get_model(self._resolve_model_path(), mx.float16)
+            mx.eval(model.parameters())
+            logger.info("✓ MLX Whisper weights preloaded")
+        except Exception as e:
+            logger.debug(f"Could not preload MLX Whisper weights: {e}")
+
     def _setup_ssl_for_huggingface(self):
         """Configure SSL certificates for HuggingFace downloads (Zscaler compatibility)"""
-        import os
-        import ssl
+        # The cert environment is process-wide, so configure it only once
+        if MLXWhisperClient._ssl_configured:
+            return
+        MLXWhisperClient._ssl_configured = True
 
         # Check for Zscaler certificate in environment or use system defaults
         ssl_cert_file = os.getenv('SSL_CERT_FILE')
@@ -122,57 +292,38 @@ class MLXWhisperClient:
 
     def _get_model_size(self):
         """Get approximate model size in MB"""
-        sizes = {
-            "tiny": 39,
-            "base": 140,
-            "small": 244,
-            "medium": 769,
-            "large": 2900,
-            "large-v3": 2900,
-        }
-        return sizes.get(self.model_size, 2900)
-
-    def transcribe_audio(self, audio_file_path):
+        return self.model_sizes_mb.get(self.model_size, 2900)
+
+    def transcribe_audio(self, audio):
         """
-        Transcribe audio file using MLX Whisper
+        Transcribe audio using MLX Whisper
 
         Auto-detects language and translates to English using local models if needed.
+        Decoding always runs in float16 (half the memory traffic of float32 on the GPU).
 
         Args:
-            audio_file_path: Path to audio file (WAV, MP3, etc)
+            audio: Path to audio file (WAV, MP3, etc), or a float32 numpy array of
+                   16 kHz mono samples in [-1, 1] (skips the ffmpeg decode and resample)
 
         Returns:
             Transcribed text in English
         """
         try:
-            if not os.path.exists(audio_file_path):
-                raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
+            if isinstance(audio, str) and not os.path.exists(audio):
+                raise FileNotFoundError(f"Audio file not found: {audio}")
 
             logger.info(f"🎙️ TRANSCRIPTION: Using LOCAL model - MLX Whisper ({self.model_size})")
 
             # Use local cache path directly instead of HF repo name to avoid network calls
             # mlx-whisper doesn't respect HF_HUB_OFFLINE when using repo names
-            cache_dir = os.path.expanduser('~/.cache/huggingface/hub')
-            model_repo = self.model_map.get(self.model_size, "mlx-community/whisper-large-v3-mlx")
-            cache_model_dir = os.path.join(cache_dir, f"models--{model_repo.replace('/', '--')}")
-
-            # Find the snapshot directory (HF cache structure: models--*/snapshots/<hash>/)
-            snapshots_dir = os.path.join(cache_model_dir, "snapshots")
-            if os.path.exists(snapshots_dir):
-                # Get the first (and usually only) snapshot hash
-                snapshot_dirs = os.listdir(snapshots_dir)
-                if snapshot_dirs:
-                    cache_path = os.path.join(snapshots_dir, snapshot_dirs[0])
-                    logger.debug(f"Using cached model at: {cache_path}")
-                else:
-                    raise FileNotFoundError(f"No snapshots found in {snapshots_dir}")
-            else:
-                raise FileNotFoundError(f"Model not cached. Run: ./setup_mlx_models.sh")
+            cache_path = self.model_path or self._resolve_model_path()
 
-            # Transcribe using local cache path (prevents any API calls)
+            # Transcribe using local cache path (prevents any API calls); mlx_whisper reuses
+            # the model preloaded in _load_model since the path and dtype (float16) match
             result = self.mlx_whisper.transcribe(
-                audio_file_path,
-                path_or_hf_repo=cache_path
+                audio,
+                path_or_hf_repo=cache_path,
+                fp16=True
             )
 
             # Extract transcribed text
@@ -204,69 +355,53 @@ class MLXWhisperClient:
 
         Returns True if text contains primarily English characters
         """
-        try:
-            # Try to detect non-Latin scripts (Hindi, Arabic, Chinese, Japanese, Korean)
-            non_latin_ranges = [
-                (0x0900, 0x097F),    # Devanagari (Hindi)
-                (0x0600, 0x06FF),    # Arabic
-                (0x4E00, 0x9FFF),    # CJK Unified Ideographs (Chinese)
-                (0x3040, 0x309F),    # Hiragana (Japanese)
-                (0x30A0, 0x30FF),    # Katakana (Japanese)
-                (0xAC00, 0xD7AF),    # Hangul (Korean)
-            ]
-
-            for char in text:
-                char_code = ord(char)
-                for start, end in non_latin_ranges:
-                    if start <= char_code <= end:
-                        return False
-
+        # Pure-ASCII text (the common case) can't contain a non-Latin script
+        if text.isascii():
             return True
-        except Exception as e:
-            logger.debug(f"Error checking if text is English: {e}")
-            return True  # Default to True on error
+        # Single C-level scan for any character in a non-Latin script
+        return _NON_LATIN_RE.search(text) is None
+
+    def refresh_cache_status(self):
+        """Forget memoized translation-model cache checks (e.g. after downloading a model)"""
+        self._translation_cache_status.clear()
 
     def _is_translation_model_cached(self, model_name):
         """
-        Check if a translation model is actually cached and has required files
+        Check if a translation model is actually cached and has required files.
+        The result is memoized per model; call refresh_cache_status() to re-check.
 
         Returns True only if model cache exists with config.json, False otherwise
         """
+        cached = self._translation_cache_status.get(model_name)
+        if cached is None:
+            cached = self._translation_cache_status[model_name] = self._check_translation_model_cache(model_name)
+        return cached
+
+    def _check_translation_model_cache(self, model_name):
+        """Inspect the Hugging Face cache for a translation model snapshot with config.json"""
         try:
-            cache_dir = os.path.expanduser('~/.cache/huggingface/hub')
             # Convert model name (e.g., "Helsinki-NLP/opus-mt-ur-en") to cache directory name
             cache_model_dir = model_name.replace('/', '--')
-            cache_path = os.path.join(cache_dir, f"models--{cache_model_dir}")
+            cache_path = os.path.join(HF_CACHE_DIR, f"models--{cache_model_dir}")
 
             logger.debug(f"Checking cache for {model_name} at {cache_path}")
 
-            # Check if cache directory exists
-            if not os.path.exists(cache_path):
-                logger.debug(f"Model cache directory not found: {cache_path}")
-                return False
-
-            # Verify critical model files exist (config.json is required)
+            # Check for snapshot directories with config.json; a missing cache or
+            # snapshots directory surfaces as FileNotFoundError from scandir
             snapshots_path = os.path.join(cache_path, "snapshots")
-            if not os.path.exists(snapshots_path):
-                logger.debug(f"Model cache incomplete (no snapshots directory): {cache_path}")
-                return False
-
-            # Check if there are snapshot directories with config.json
             try:
-                snapshots = os.listdir(snapshots_path)
-                if not snapshots:
-                    logger.debug(f"Model snapshots directory is empty: {snapshots_path}")
-                    return False
-
-                for snapshot in snapshots:
-                    snapshot_path = os.path.join(snapshots_path, snapshot)
-                    if os.path.isdir(snapshot_path):
-                        config_file = os.path.join(snapshot_path, "config.json")
-                        if os.path.exists(config_file):
+                with os.scandir(snapshots_path) as entries:
+                    for entry in entries:
+                        # DirEntry.is_dir() uses the cached dirent type, no extra stat
+                        if not entry.is_dir():
+                            continue
+                        if os.path.exists(os.path.join(entry.path, "config.json")):
                             logger.debug(f"✓ Model cache valid for {model_name}")
                             return True
-                        else:
-                            logger.debug(f"  Snapshot {snapshot} missing config.json")
+                        logger.debug(f"  Snapshot {entry.name} missing config.json")
+            except FileNotFoundError:
+                logger.debug(f"Model cache not found or incomplete (no snapshots directory): {cache_path}")
+                return False
             except Exception as e:
                 logger.debug(f"Error checking snapshots: {e}")
                 return False
@@ -293,17 +428,7 @@ class MLXWhisperClient:
             Translated text in English
         """
         try:
-            import torch
-            import signal
-
-            # Map language codes to Helsinki-NLP model names
-            model_map = {
-                "hi": "Helsinki-NLP/opus-mt-hi-en",    # Hindi to English
-                "ur": "Helsinki-NLP/opus-mt-ur-en",    # Urdu to English
-                "zh": "Helsinki-NLP/opus-mt-zh-en",    # Chinese to English
-            }
-
-            model_name = model_map.get(source_lang)
+            model_name = self.translation_models.get(source_lang)
             if not model_name:
                 logger.debug(f"No local translation model for {source_lang}, trying OpenAI...")
                 return self._translate_with_openai(text)
@@ -315,57 +440,18 @@ class MLXWhisperClient:
 
             logger.info(f"🌐 TRANSLATION: Using LOCAL model - {model_name} ({source_lang}→en)")
             try:
-                # Save original environment variables
-                old_offline = os.environ.get('HF_HUB_OFFLINE')
-                old_transformers_offline = os.environ.get('TRANSFORMERS_OFFLINE')
-                old_huggingface_offline = os.environ.get('HUGGINGFACE_CO_OFFLINE')
-
-                try:
-                    # Set offline BEFORE any transformers imports
-                    os.environ['HF_HUB_OFFLINE'] = '1'
-                    os.environ['TRANSFORMERS_OFFLINE'] = '1'
-                    os.environ['HUGGINGFACE_CO_OFFLINE'] = '1'
-
-                    # Import transformers AFTER setting offline mode
-                    from transformers import pipeline
-
-                    def timeout_handler(signum, frame):
-                        raise TimeoutError("Translation model loading timeout - falling back to OpenAI")
-
-                    # Set a 10 second timeout to prevent hanging on network retries
-                    signal.signal(signal.SIGALRM, timeout_handler)
-                    signal.alarm(10)
-
-                    try:
-                        # Use CPU for compatibility, local_files_only=True prevents any network access
-                        translator = pipeline("translation", model=model_name, device=-1 if torch.cuda.is_available() else -1, local_files_only=True)
-
-                        logger.debug(f"Translating {source_lang} text to English...")
-                        result = translator(text, max_length=512)
-                        translated_text = result[0]["translation_text"]
-
-                        logger.info(f"✓ Local translation successful: {translated_text}")
-                        return translated_text
-                    finally:
-                        # Cancel the timeout alarm
-                        signal.alarm(0)
-
-                finally:
-                    # Restore original environment variables
-                    if old_offline is None:
-                        os.environ.pop('HF_HUB_OFFLINE', None)
-                    else:
-                        os.environ['HF_HUB_OFFLINE'] = old_offline
-
-                    if old_transformers_offline is None:
-                        os.environ.pop('TRANSFORMERS_OFFLINE', None)
-                    else:
-                        os.environ['TRANSFORMERS_OFFLINE'] = old_transformers_offline
-
-                    if old_huggingface_offline is None:
-                        os.environ.pop('HUGGINGFACE_CO_OFFLINE', None)
-                    else:
-                        os.environ['HUGGINGFACE_CO_OFFLINE'] = old_huggingface_offline
+                # Build each translator once; later utterances in the same language reuse it
+                translator = self._translators.get(model_name)
+                if translator is None:
+                    translator = self._load_translator(model_name)
+                    self._translators[model_name] = translator
+
+                logger.debug(f"Translating {source_lang} text to English...")
+                result = translator(text, max_length=512)
+                translated_text = result[0]["translation_text"]
+
+                logger.info(f"✓ Local translation successful: {translated_text}")
+                return translated_text
 
             except (TimeoutError, Exception) as pipeline_error:
                 # If pipeline fails (timeout, SSL, missing files, etc), fall back immediately
@@ -378,6 +464,39 @@ class MLXWhisperClient:
             logger.debug("Falling back to OpenAI translation...")
             return self._translate_with_openai(text)
 
+    def _load_translator(self, model_name):
+        """
+        Build a translator from local files only (no network access).
+
+        Uses the int8 CTranslate2 conversion when one exists under CT2_MODELS_DIR and
+        ctranslate2 is installed (2-3x faster on CPU), otherwise a transformers pipeline
+        from the Hugging Face cache.
+
+        Args:
+            model_name: Helsinki-NLP model id (e.g. "Helsinki-NLP/opus-mt-hi-en")
+
+        Returns:
+            Callable translator: translator(text, max_length=512) -> [{"translation_text": ...}]
+        """
+        global _translator_executor
+
+        # Offline mode was set process-wide in _load_model, before any Hugging Face import.
+        # The whole build, transformers import and tokenizer included, runs on the loader
+        # thread so all of it counts against the timeout
+        executor = _translator_executor
+        future = executor.submit(_build_translator, model_name)
+
+        # Wait on the loader thread so the timeout works off the main thread (unlike SIGALRM)
+        try:
+            return future.result(timeout=_TRANSLATOR_LOAD_TIMEOUT)
+        except FutureTimeoutError:
+            # The build can't be interrupted; it finishes in the background and is discarded.
+            # Give later loads a fresh worker instead of queueing them behind it
+            if _translator_executor is executor:
+                _translator_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='translator-load')
+            executor.shutdown(wait=False)
+            raise TimeoutError("Translation model loading timeout - falling back to OpenAI")
+
     def _translate_with_openai(self, text):
         """
         Translate text to English using OpenAI API (fallback)
@@ -385,9 +504,11 @@ class MLXWhisperClient:
         Only used if local translation fails and internet is available.
         """
         try:
-            from openai_client import OpenAIClient
+            client = self._openai_client
+            if client is None:
+                from openai_client import OpenAIClient
+                client = self._openai_client = OpenAIClient()
 
-            client = OpenAIClient()
             if client.is_available():
                 logger.info(f"🌐 TRANSLATION: Using CLOUD model - OpenAI gpt-4o-mini")
                 result = client.translate_to_english(text)
@@ -1,14 +1,167 @@
 #!/usr/bin/env python3
 # ABOUTME: OpenAI client for AI-powered text enhancement, STT, and TTS using GPT models
+import functools
+import importlib.util
+import json
 import os
+import re
+import shutil
 import ssl
+import subprocess
+import threading
+import time
+from collections import OrderedDict
 from dotenv import load_dotenv
 from logger_config import setup_logging
+# The openai SDK and httpx take hundreds of ms to import; they are imported when the
+# client is first built (see OpenAIClient.client), not when the app starts
+OPENAI_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ('openai', 'httpx'))
+try:
+    # Rust JSON parser; its JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 # Load environment variables
 load_dotenv()
 logger = setup_logging()
 
+# macOS 'say' speaking rate (words per minute) at 1.0x speed
+SAY_BASE_RATE = 175
+
+# Keep idle connections for 75s (nginx's keepalive default) so requests a few seconds
+# apart reuse the socket instead of paying a new TCP+TLS handshake
+KEEPALIVE_EXPIRY = 75.0
+
+# HTTP/2 multiplexes concurrent requests over one connection; needs httpx[http2] (h2)
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# Characters from non-Latin scripts that mark a transcript as non-English
+_NON_LATIN_RE = re.compile(
+    '['
+    '\u0900-\u097F'  # Devanagari (Hindi)
+    '\u0600-\u06FF'  # Arabic
+    '\u4E00-\u9FFF'  # Chinese
+    '\u3040-\u30FF'  # Japanese
+    '\uAC00-\uD7AF'  # Korean
+    ']'
+)
+
+# Prompt for enhance_text; filled with str.format per request
+_ENHANCE_PROMPT = """You are helping a user edit text based on voice commands. The user has selected some text and given a voice instruction for how to modify it.
+
+Selected text: "{selected}"
+Voice instruction: "{instruction}"
+
+Please modify the selected text according to the voice instruction. Return only the modified text without any explanation or additional formatting."""
+
+# Prompts for parse_task_command (the system prompt is constant)
+_TASK_SYSTEM_PROMPT = """You are a task command parser. Extract task information from voice commands and return ONLY valid JSON.
+
+Commands:
+- ADD: "task add [description] [priority: high/medium/low] [due: tomorrow/today/monday/date] [category: name]"
+- COMPLETE: "task complete [description/number]"
+- LIST: "task list [filter: all/pending/today/high/category]"
+- ARCHIVE: "task archive [description/number]"
+
+Return JSON with these fields:
+{
+  "action": "add|complete|list|archive",
+  "description": "task description",
+  "priority": "high|medium|low|null",
+  "due_date": "YYYY-MM-DD|null",
+  "category": "category name|null",
+  "identifier": "task description or number|null",
+  "filter": "filter type|null"
+}
+
+Date parsing rules:
+- "tomorrow" = current_date + 1 day
+- "today" = current_date
+- "monday", "tuesday", etc. = next occurrence of that weekday
+- "next week" = current_date + 7 days
+- Specific dates like "december 25" should be converted to YYYY-MM-DD format
+
+Examples:
+Input: "task add buy milk high priority tomorrow food"
+Output: {"action": "add", "description": "buy milk", "priority": "high", "due_date": "[tomorrow's date]", "category": "food", "identifier": null, "filter": null}
+
+Input: "task complete buy milk"
+Output: {"action": "complete", "description": null, "priority": null, "due_date": null, "category": null, "identifier": "buy milk", "filter": null}
+
+Input: "task list high priority tasks"
+Output: {"action": "list", "description": null, "priority": null, "due_date": null, "category": null, "identifier": null, "filter": "high"}
+
+Return ONLY a valid JSON object."""
+
+_TASK_USER_PROMPT = "Parse this voice command: \"{text}\"\n\nCurrent date: {date}"
+
+# Uploads above ~30s of 16 kHz WAV are transcoded to Opus first; shorter clips
+# upload faster than ffmpeg can start
+_COMPRESS_MIN_BYTES = 1_000_000
+_FFMPEG = shutil.which('ffmpeg')
+
+def _compress_for_whisper(audio_bytes):
+    """
+    Transcode audio to 16 kHz mono 24 kbps Opus (Ogg) with ffmpeg, ~20x smaller than PCM WAV.
+
+    Returns:
+        (filename, bytes) upload tuple, or None if ffmpeg is missing or fails
+    """
+    if not _FFMPEG:
+        return None
+    try:
+        result = subprocess.run(
+            [_FFMPEG, '-hide_banner', '-loglevel', 'error', '-i', 'pipe:0',
+             '-ac', '1', '-ar', '16000', '-c:a', 'libopus', '-b:a', '24k', '-f', 'ogg', 'pipe:1'],
+            input=audio_bytes, capture_output=True, check=True, timeout=30
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"Audio compression failed, uploading original: {e}")
+        return None
+    logger.debug(f"Compressed audio for upload: {len(audio_bytes)} → {len(result.stdout)} bytes")
+    return ('audio.ogg', result.stdout)
+
+class EnhancementTruncated(Exception):
+    """The model hit its output token limit before finishing the enhanced text"""
+
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire ttl seconds after being stored"""
+
+    def __init__(self, maxsize=512, ttl=600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+@functools.cache
+def _ssl_context(cert_path):
+    """Build one SSLContext per CA bundle; parsing the bundle is the expensive part"""
+    if isinstance(cert_path, str):
+        return ssl.create_default_context(cafile=cert_path)
+    return ssl.create_default_context()
+
 class OpenAIClient:
     def __init__(self):
         """Initialize OpenAI client"""
@@ -18,61 +171,136 @@ class OpenAIClient:
         self.whisper_model = os.getenv('OPENAI_WHISPER_MODEL', 'gpt-4o-mini-transcribe')
         self.tts_model = os.getenv('OPENAI_TTS_MODEL', 'gpt-4o-mini-tts')
         self.tts_voice = os.getenv('OPENAI_TTS_VOICE', 'alloy')
+        # Voice for the local 'say' TTS; unset follows the macOS system voice
+        self.say_voice = os.getenv('SAY_VOICE')
         self.use_openai_whisper = os.getenv('USE_OPENAI_WHISPER', 'false').lower() == 'true'
+        # Model-dependent request options, fixed for the client's lifetime
+        self._init_request_options()
+
+        # Exact-match results of repeated translations and task commands (10 min TTL)
+        self._response_cache = _TTLCache(maxsize=512, ttl=600)
+
+        # Sync client, built on first use by the client property
+        self._client = None
+        self._client_built = False
+        self._client_lock = threading.Lock()
+
+        if not self.api_key:
+            logger.warning("OPENAI_API_KEY not found in environment variables")
+        elif not OPENAI_AVAILABLE:
+            logger.error("OpenAI library not installed. Install with: pip install openai")
+        else:
+            # Build the client and open the TLS connection now, off the caller's thread, so
+            # neither the SDK import nor the handshake lands on the first voice command
+            # (keep-alive holds the connection for KEEPALIVE_EXPIRY)
+            threading.Thread(target=self._warm_up_connection, name="openai-warmup", daemon=True).start()
+
+    @property
+    def client(self):
+        """Sync OpenAI client, or None without an API key / the openai package"""
+        if not self._client_built:
+            with self._client_lock:
+                if not self._client_built:
+                    self._client = self._build_client()
+                    self._client_built = True
+        return self._client
+
+    def _build_client(self):
+        """Import the SDK and create the sync OpenAI client"""
+        if not self.api_key or not OPENAI_AVAILABLE:
+            return None
 
-        # Initialize OpenAI client
         try:
-            if self.api_key:
-                from openai import OpenAI
-                import httpx
-
-                # Check if SSL verification should be disabled (for local testing only)
-                disable_ssl = os.getenv('OPENAI_DISABLE_SSL_VERIFY', 'false').lower() == 'true'
-
-                if disable_ssl:
-                    logger.warning("⚠️  SSL VERIFICATION DISABLED - for local testing only!")
-                    # Configure httpx client with disabled SSL and longer timeout
-                    http_client = httpx.Client(
-                        verify=False,
-                        timeout=30.0,
-                        limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
-                    )
-                else:
-                    # Try to find the best CA bundle for SSL verification (handles Zscaler)
-                    ssl_cert_path = self._get_ssl_cert_path()
-                    http_client = httpx.Client(
-                        verify=ssl_cert_path,
-                        timeout=30.0,
-                        limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
-                    )
-
-                self.client = OpenAI(
-                    api_key=self.api_key,
-                    http_client=http_client,
-                    max_retries=2  # Reduce retries to fail faster
-                )
-                logger.info(f"OpenAI client initialized")
-                logger.info(f"  - Text model: {self.model}")
-                logger.info(f"  - Task model: {self.task_model}")
-                logger.info(f"  - Whisper model: {self.whisper_model} (enabled: {self.use_openai_whisper})")
-                logger.info(f"  - Whisper mode: Auto-detect language → Transcribe → Auto-translate to English")
-                logger.info(f"  - TTS model: {self.tts_model}")
-                if not disable_ssl:
-                    ssl_cert_path = self._get_ssl_cert_path()
-                    logger.info(f"  - SSL certs: {ssl_cert_path}")
+            from openai import OpenAI
+            import httpx
+
+            # Check if SSL verification should be disabled (for local testing only)
+            disable_ssl = os.getenv('OPENAI_DISABLE_SSL_VERIFY', 'false').lower() == 'true'
+
+            if disable_ssl:
+                logger.warning("⚠️  SSL VERIFICATION DISABLED - for local testing only!")
+                ssl_verify = False
             else:
-                logger.warning("OPENAI_API_KEY not found in environment variables")
-                self.client = None
-        except ImportError:
-            logger.error("OpenAI library not installed. Install with: pip install openai")
-            self.client = None
+                # Try to find the best CA bundle for SSL verification (handles Zscaler);
+                # every client instance shares its context
+                ssl_cert_path = self._get_ssl_cert_path()
+                ssl_verify = _ssl_context(ssl_cert_path)
+
+            # Configure httpx client with the chosen SSL verification and longer timeout
+            http_client = httpx.Client(
+                verify=ssl_verify,
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_keepalive_connections=10, max_connections=10, keepalive_expiry=KEEPALIVE_EXPIRY
+                ),
+                http2=HTTP2_AVAILABLE
+            )
+
+            client = OpenAI(
+                api_key=self.api_key,
+                http_client=http_client,
+                max_retries=2  # Reduce retries to fail faster
+            )
+            logger.info(f"OpenAI client initialized")
+            logger.info(f"  - Text model: {self.model}")
+            logger.info(f"  - Task model: {self.task_model}")
+            logger.info(f"  - Whisper model: {self.whisper_model} (enabled: {self.use_openai_whisper})")
+            logger.info(f"  - Whisper mode: Auto-detect language → Transcribe → Auto-translate to English")
+            logger.info(f"  - TTS model: {self.tts_model}")
+            if not disable_ssl:
+                logger.info(f"  - SSL certs: {ssl_cert_path}")
+            return client
         except Exception as e:
             logger.error(f"Error initializing OpenAI client: {e}")
-            self.client = None
+            return None
 
     def is_available(self):
-        """Check if OpenAI client is available and initialized"""
-        return self.client is not None
+        """Check if OpenAI can be used; doesn't build the client if it hasn't been yet"""
+        if self._client_built:
+            return self._client is not None
+        return bool(self.api_key) and OPENAI_AVAILABLE
+
+    def _warm_up_connection(self):
+        """Make one cheap authenticated request to establish the pooled connection"""
+        try:
+            client = self.client
+            if client:
+                client.models.list()
+                logger.debug("OpenAI connection warmed up")
+        except Exception as e:
+            logger.debug(f"OpenAI connection warm-up failed: {e}")
+
+    def _init_request_options(self):
+        """Precompute the token-limit/temperature kwargs each request type adds for its model"""
+        is_gpt5 = self.model.startswith('gpt-5')
+        # GPT-5 Nano only supports temperature=1 (default)
+        is_nano = 'nano' in self.model.lower()
+
+        # GPT-5 specific settings
+        if is_gpt5:
+            self._enhance_options = {'max_completion_tokens': 1000}
+            self._translate_options = {'max_completion_tokens': 500}
+            if not is_nano:
+                self._enhance_options['temperature'] = 0.7
+                self._translate_options['temperature'] = 0.3
+            # Use max_completion_tokens for GPT-5 models
+            self._test_options = {'max_completion_tokens': 50}
+        else:
+            self._enhance_options = {'max_tokens': 1000, 'temperature': 0.7}
+            self._translate_options = {'max_tokens': 500, 'temperature': 0.3}
+            self._test_options = {'max_tokens': 50}
+
+        # Use appropriate token limits and temperature for task parsing
+        if self.task_model.startswith('gpt-5'):
+            # GPT-5 models use reasoning tokens, need much higher limit
+            # reasoning_tokens (~200) + output_tokens (~100) = ~300 total
+            # GPT-5 models only support temperature=1 (default)
+            self._task_options = {'max_completion_tokens': 500}
+        elif self.task_model.startswith('gpt-4o'):
+            # gpt-4o models only support temperature=1 (default)
+            self._task_options = {'max_tokens': 200}
+        else:
+            self._task_options = {'max_tokens': 200, 'temperature': 0.3}  # Lower temp for structured output
 
     def _get_ssl_cert_path(self):
         """
@@ -82,8 +310,6 @@ class OpenAIClient:
         2. System default CA bundle
         3. certifi package fallback
         """
-        import os
-
         # Check for environment variable overrides first (used for Zscaler setup)
         for env_var in ['SSL_CERT_FILE', 'REQUESTS_CA_BUNDLE']:
             cert_path = os.getenv(env_var)
@@ -110,62 +336,93 @@ class OpenAIClient:
     def enhance_text(self, transcribed_text, selected_text):
         """
         Send transcribed instruction and selected text to OpenAI.
-        Returns the enhanced/modified text.
+        Returns the enhanced/modified text, or selected_text unchanged if the
+        response was cut off at the output token limit.
         """
         if not self.client:
             raise Exception("OpenAI client not initialized")
 
         logger.info(f"📝 TEXT ENHANCEMENT: Using CLOUD model - OpenAI {self.model}")
 
-        # Construct the prompt for GPT
-        prompt = f"""You are helping a user edit text based on voice commands. The user has selected some text and given a voice instruction for how to modify it.
-
-Selected text: "{selected_text}"
-Voice instruction: "{transcribed_text}"
-
-Please modify the selected text according to the voice instruction. Return only the modified text without any explanation or additional formatting."""
-
         try:
-            # Use Chat Completions API
-            kwargs = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are a helpful text editing assistant. Follow user instructions precisely and return only the modified text."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            }
+            response = self.client.chat.completions.create(**self._enhance_kwargs(transcribed_text, selected_text))
+            if response.choices and response.choices[0].finish_reason == 'length':
+                logger.warning("⚠️  Enhancement hit the output token limit - keeping the original text")
+                return selected_text
+            return self._enhanced_text_from(response)
+        except Exception as e:
+            logger.error(f"Error calling OpenAI: {e}")
+            raise
 
-            # GPT-5 specific settings
-            if self.model.startswith('gpt-5'):
-                kwargs['max_completion_tokens'] = 1000
-                # GPT-5 Nano only supports temperature=1 (default)
-                if 'nano' not in self.model.lower():
-                    kwargs['temperature'] = 0.7
-            else:
-                kwargs['max_tokens'] = 1000
-                kwargs['temperature'] = 0.7
+    def enhance_text_stream(self, transcribed_text, selected_text):
+        """
+        Streaming enhance_text: yields pieces of the modified text as the model generates them,
+        so callers can show progress from the first token instead of after the whole response.
+        Join the pieces and strip to get the same result enhance_text returns.
 
-            response = self.client.chat.completions.create(**kwargs)
+        Raises:
+            EnhancementTruncated: After the last piece, if the response was cut off
+                at the output token limit (the pieces are then incomplete)
+        """
+        if not self.client:
+            raise Exception("OpenAI client not initialized")
 
-            # Extract the generated text
-            if response.choices and len(response.choices) > 0:
-                enhanced_text = response.choices[0].message.content.strip()
-                logger.debug(f"OpenAI response: {enhanced_text}")
-                logger.info(f"✓ Text enhancement successful")
-                return enhanced_text
-            else:
-                raise Exception("No content in OpenAI response")
+        logger.info(f"📝 TEXT ENHANCEMENT: Using CLOUD model - OpenAI {self.model} (streaming)")
 
+        try:
+            stream = self.client.chat.completions.create(
+                **self._enhance_kwargs(transcribed_text, selected_text), stream=True
+            )
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                if chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                if chunk.choices[0].finish_reason == 'length':
+                    raise EnhancementTruncated("Enhancement hit the output token limit")
+        except EnhancementTruncated:
+            raise
         except Exception as e:
             logger.error(f"Error calling OpenAI: {e}")
             raise
 
+    def _enhance_kwargs(self, transcribed_text, selected_text):
+        """Build the Chat Completions request for enhance_text"""
+        # Construct the prompt for GPT
+        prompt = _ENHANCE_PROMPT.format(selected=selected_text, instruction=transcribed_text)
+
+        kwargs = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are a helpful text editing assistant. Follow user instructions precisely and return only the modified text."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            **self._enhance_options
+        }
+
+        # Size the output budget to the selection (~4 chars/token) with room for the edit to
+        # grow 3x, instead of a flat 1000; GPT-5 limits also cover reasoning tokens, so those
+        # stay fixed. Truncated responses are detected via finish_reason, never pasted
+        if 'max_tokens' in kwargs:
+            kwargs['max_tokens'] = min(1000, max(512, len(selected_text or '') * 3 // 4))
+        return kwargs
+
+    def _enhanced_text_from(self, response):
+        """Extract the generated text from an enhancement response"""
+        if response.choices and len(response.choices) > 0:
+            enhanced_text = response.choices[0].message.content.strip()
+            logger.debug(f"OpenAI response: {enhanced_text}")
+            logger.info(f"✓ Text enhancement successful")
+            return enhanced_text
+        else:
+            raise Exception("No content in OpenAI response")
+
     def test_connection(self):
         """Test if OpenAI client is working properly"""
         if not self.client:
@@ -181,15 +438,10 @@ Please modify the selected text according to the voice instruction. Return only
                         "role": "user",
                         "content": "Say 'Hello, OpenAI connection successful!'"
                     }
-                ]
+                ],
+                **self._test_options
             }
 
-            # Use max_completion_tokens for GPT-5 models
-            if self.model.startswith('gpt-5'):
-                kwargs['max_completion_tokens'] = 50
-            else:
-                kwargs['max_tokens'] = 50
-
             response = self.client.chat.completions.create(**kwargs)
 
             if response.choices and len(response.choices) > 0:
@@ -200,37 +452,23 @@ Please modify the selected text according to the voice instruction. Return only
         except Exception as e:
             return False, str(e)
 
-    def is_available(self):
-        """Check if OpenAI client is available and configured"""
-        return self.client is not None
-
     def is_english(self, text):
         """
         Quick check if text is primarily English.
         Returns True if English, False otherwise.
         """
-        if not text:
+        # Empty or pure-ASCII text (most transcripts) has no non-Latin characters
+        if not text or text.isascii():
             return True
 
-        # Check for non-Latin scripts (Hindi, Chinese, Arabic, etc.)
+        # If more than 10% non-Latin, consider it non-English; the regex scans in C
+        # and finditer stops as soon as the threshold is crossed
+        limit = len(text) * 0.1
         non_latin_chars = 0
-        for char in text:
-            # Check if character is from non-Latin Unicode blocks
-            code = ord(char)
-            # Devanagari (Hindi): 0x0900-0x097F
-            # Arabic: 0x0600-0x06FF
-            # Chinese: 0x4E00-0x9FFF
-            # And many others...
-            if (0x0900 <= code <= 0x097F or  # Devanagari
-                0x0600 <= code <= 0x06FF or  # Arabic
-                0x4E00 <= code <= 0x9FFF or  # Chinese
-                0x3040 <= code <= 0x30FF or  # Japanese
-                0xAC00 <= code <= 0xD7AF):   # Korean
-                non_latin_chars += 1
-
-        # If more than 10% non-Latin, consider it non-English
-        if len(text) > 0 and non_latin_chars / len(text) > 0.1:
-            return False
+        for _ in _NON_LATIN_RE.finditer(text):
+            non_latin_chars += 1
+            if non_latin_chars > limit:
+                return False
 
         return True
 
@@ -241,44 +479,53 @@ Please modify the selected text according to the voice instruction. Return only
         if not self.client:
             raise Exception("OpenAI client not initialized")
 
-        try:
-            kwargs = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are a translator. Translate the given text to English. Return ONLY the English translation, no explanations."
-                    },
-                    {
-                        "role": "user",
-                        "content": text
-                    }
-                ]
-            }
-
-            # GPT-5 specific settings
-            if self.model.startswith('gpt-5'):
-                kwargs['max_completion_tokens'] = 500
-                if 'nano' not in self.model.lower():
-                    kwargs['temperature'] = 0.3
-            else:
-                kwargs['max_tokens'] = 500
-                kwargs['temperature'] = 0.3
-
-            response = self.client.chat.completions.create(**kwargs)
-
-            if response.choices and len(response.choices) > 0:
-                translated = response.choices[0].message.content.strip()
-                logger.info(f"Translated to English: {translated}")
-                return translated
-            else:
-                raise Exception("No content in translation response")
+        key = ('translate', self.model, text)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            logger.debug("Translation served from cache")
+            return cached
 
+        try:
+            response = self.client.chat.completions.create(**self._translate_kwargs(text))
+            translated = self._translation_from(response)
+            self._response_cache.put(key, translated)
+            return translated
         except Exception as e:
             logger.error(f"Error translating to English: {e}")
             # Return original text as fallback
             return text
 
+    def _translate_kwargs(self, text):
+        """Build the Chat Completions request for translate_to_english"""
+        kwargs = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are a translator. Translate the given text to English. Return ONLY the English translation, no explanations."
+                },
+                {
+                    "role": "user",
+                    "content": text
+                }
+            ],
+            **self._translate_options
+        }
+
+        # Budget by input length (non-Latin scripts can run ~1 token/char); 128 covers short phrases
+        if 'max_tokens' in kwargs:
+            kwargs['max_tokens'] = min(500, max(128, len(text)))
+        return kwargs
+
+    def _translation_from(self, response):
+        """Extract the translated text from a translation response"""
+        if response.choices and len(response.choices) > 0:
+            translated = response.choices[0].message.content.strip()
+            logger.info(f"Translated to English: {translated}")
+            return translated
+        else:
+            raise Exception("No content in translation response")
+
     def transcribe_audio(self, audio_file_path, language=None):
         """
         Transcribe audio file using OpenAI Whisper API.
@@ -290,23 +537,48 @@ Please modify the selected text according to the voice instruction. Return only
 
         Returns transcribed text in English.
         """
+        if os.path.getsize(audio_file_path) >= _COMPRESS_MIN_BYTES:
+            with open(audio_file_path, 'rb') as audio_file:
+                audio_bytes = audio_file.read()
+            return self.transcribe_audio_bytes(audio_bytes, os.path.basename(audio_file_path), language)
+
+        with open(audio_file_path, 'rb') as audio_file:
+            return self._transcribe(audio_file, language)
+
+    def transcribe_audio_bytes(self, audio_bytes, filename='audio.wav', language=None):
+        """
+        Transcribe in-memory audio using OpenAI Whisper API, without a file on disk.
+
+        Args:
+            audio_bytes: Encoded audio (e.g. a complete WAV file)
+            filename: Name sent with the upload; its extension tells the API the format
+            language: Optional language code (e.g., 'en', 'es', 'hi')
+
+        Returns transcribed text in English.
+        """
+        upload = None
+        if len(audio_bytes) >= _COMPRESS_MIN_BYTES:
+            upload = _compress_for_whisper(audio_bytes)
+        return self._transcribe(upload or (filename, audio_bytes), language)
+
+    def _transcribe(self, audio_file, language=None):
+        """Send audio (open file or (filename, bytes) tuple) to the transcriptions endpoint"""
         if not self.client:
             raise Exception("OpenAI client not initialized")
 
         try:
             logger.info(f"🎙️ TRANSCRIPTION: Using CLOUD model - OpenAI {self.whisper_model}")
 
-            with open(audio_file_path, 'rb') as audio_file:
-                # Use transcriptions endpoint
-                kwargs = {
-                    "model": self.whisper_model,
-                    "file": audio_file,
-                    "response_format": "text"
-                }
-                if language:
-                    kwargs["language"] = language
+            # Use transcriptions endpoint
+            kwargs = {
+                "model": self.whisper_model,
+                "file": audio_file,
+                "response_format": "text"
+            }
+            if language:
+                kwargs["language"] = language
 
-                response = self.client.audio.transcriptions.create(**kwargs)
+            response = self.client.audio.transcriptions.create(**kwargs)
 
             transcribed = response.strip() if isinstance(response, str) else response.text.strip()
             logger.info(f"✓ OpenAI transcription successful: {transcribed}")
@@ -323,7 +595,28 @@ Please modify the selected text according to the voice instruction. Return only
             logger.error(f"Error transcribing audio with OpenAI: {e}")
             raise
 
-    def text_to_speech(self, text, output_path=None, speed=1.0):
+    def say_voice_name(self):
+        """
+        Voice name to pass to 'say -v': SAY_VOICE if set, else the current macOS system voice.
+
+        Returns:
+            str: Voice name, or None if the system voice can't be looked up
+        """
+        if self.say_voice:
+            return self.say_voice
+        try:
+            from AppKit import NSSpeechSynthesizer, NSVoiceName
+            return NSSpeechSynthesizer.attributesForVoice_(NSSpeechSynthesizer.defaultVoice())[NSVoiceName]
+        except Exception as e:
+            logger.debug(f"Could not look up the system voice: {e}")
+            return None
+
+    @staticmethod
+    def say_rate(speed):
+        """'say -r' words per minute for a playback speed multiplier"""
+        return int(SAY_BASE_RATE * speed)
+
+    def text_to_speech(self, text, output_path=None, speed=1.0, voice=None):
         """
         Convert text to speech using macOS native 'say' command (primary) or OpenAI TTS (if explicitly enabled).
 
@@ -331,26 +624,28 @@ Please modify the selected text according to the voice instruction. Return only
             text: Text to convert to speech
             output_path: Optional file path to save audio
             speed: Playback speed multiplier (1.0 = normal, 1.2 = 20% faster, etc.)
+            voice: 'say' voice name (defaults to say_voice_name())
         """
         # Use macOS native 'say' command as PRIMARY (local, FREE, supports speed control)
         try:
-            import subprocess
-
-            # Calculate words per minute based on speed multiplier
-            # Default macOS say rate is ~175 wpm
-            base_rate = 175
-            rate = int(base_rate * speed)
+            rate = self.say_rate(speed)
+            voice = voice or self.say_voice_name()
+            # Always name the voice, so cached renders can be keyed on what was actually used
+            say = ['say', '-v', voice, '-r', str(rate)] if voice else ['say', '-r', str(rate)]
 
             logger.info(f"🔊 TTS: Using LOCAL macOS native 'say' command at {speed}x speed ({rate} wpm)")
 
             if output_path:
-                # Save to AIFF file using macOS say command with speed
-                subprocess.run(['say', '-r', str(rate), '-o', output_path.replace('.mp3', '.aiff'), text], check=True)
-                logger.info(f"Local TTS audio saved to: {output_path.replace('.mp3', '.aiff')}")
-                return output_path.replace('.mp3', '.aiff')
+                # Save as raw little-endian 16-bit PCM WAV: players consume it without any decode
+                # or byte-swap pass (AIFF is big-endian, compressed formats need a full decode)
+                output_path = output_path.replace('.mp3', '.wav')
+                subprocess.run(say + ['--file-format=WAVE', '--data-format=LEI16@22050',
+                                      '-o', output_path, text], check=True)
+                logger.info(f"Local TTS audio saved to: {output_path}")
+                return output_path
             else:
                 # Just speak directly (no file output) with speed control
-                subprocess.run(['say', '-r', str(rate), text], check=True)
+                subprocess.run(say + [text], check=True)
                 logger.info(f"✓ Local TTS playback complete at {speed}x speed")
                 return None
 
@@ -373,71 +668,29 @@ Please modify the selected text according to the voice instruction. Return only
         if not self.client:
             raise Exception("OpenAI client not initialized")
 
-        system_prompt = """You are a task command parser. Extract task information from voice commands and return ONLY valid JSON.
+        # Relative dates ("tomorrow") depend on current_date, so it is part of the key
+        key = ('task', self.task_model, text, current_date)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            logger.debug(f"Task command served from cache: {cached}")
+            return dict(cached)
 
-Commands:
-- ADD: "task add [description] [priority: high/medium/low] [due: tomorrow/today/monday/date] [category: name]"
-- COMPLETE: "task complete [description/number]"
-- LIST: "task list [filter: all/pending/today/high/category]"
-- ARCHIVE: "task archive [description/number]"
+        user_prompt = _TASK_USER_PROMPT.format(text=text, date=current_date)
 
-Return JSON with these fields:
-{
-  "action": "add|complete|list|archive",
-  "description": "task description",
-  "priority": "high|medium|low|null",
-  "due_date": "YYYY-MM-DD|null",
-  "category": "category name|null",
-  "identifier": "task description or number|null",
-  "filter": "filter type|null"
-}
-
-Date parsing rules:
-- "tomorrow" = current_date + 1 day
-- "today" = current_date
-- "monday", "tuesday", etc. = next occurrence of that weekday
-- "next week" = current_date + 7 days
-- Specific dates like "december 25" should be converted to YYYY-MM-DD format
-
-Examples:
-Input: "task add buy milk high priority tomorrow food"
-Output: {"action": "add", "description": "buy milk", "priority": "high", "due_date": "[tomorrow's date]", "category": "food", "identifier": null, "filter": null}
-
-Input: "task complete buy milk"
-Output: {"action": "complete", "description": null, "priority": null, "due_date": null, "category": null, "identifier": "buy milk", "filter": null}
-
-Input: "task list high priority tasks"
-Output: {"action": "list", "description": null, "priority": null, "due_date": null, "category": null, "identifier": null, "filter": "high"}
-
-Return ONLY valid JSON, no markdown formatting or code blocks."""
-
-        user_prompt = f"Parse this voice command: \"{text}\"\n\nCurrent date: {current_date}"
-
-        import json
         json_str = None
 
         try:
             kwargs = {
                 "model": self.task_model,
                 "messages": [
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": _TASK_SYSTEM_PROMPT},
                     {"role": "user", "content": user_prompt}
-                ]
+                ],
+                # JSON mode: the model returns a bare JSON object (no markdown fences)
+                "response_format": {"type": "json_object"},
+                **self._task_options
             }
 
-            # Use appropriate token limits and temperature
-            if self.task_model.startswith('gpt-5'):
-                # GPT-5 models use reasoning tokens, need much higher limit
-                # reasoning_tokens (~200) + output_tokens (~100) = ~300 total
-                kwargs['max_completion_tokens'] = 500
-                # GPT-5 models only support temperature=1 (default)
-            elif self.task_model.startswith('gpt-4o'):
-                kwargs['max_tokens'] = 200
-                # gpt-4o models only support temperature=1 (default)
-            else:
-                kwargs['max_tokens'] = 200
-                kwargs['temperature'] = 0.3  # Lower temp for structured output
-
             logger.debug(f"Calling OpenAI with model={self.task_model} for: {text}")
             response = self.client.chat.completions.create(**kwargs)
 
@@ -451,16 +704,12 @@ Return ONLY valid JSON, no markdown formatting or code blocks."""
                     logger.error(f"Usage: {response.usage}")
                     return None
 
-                json_str = content.strip()
-                # Remove markdown code blocks if present
-                json_str = json_str.replace('```json', '').replace('```', '').strip()
-
-                if not json_str:
-                    logger.error("GPT response is empty after cleanup")
-                    return None
-
-                parsed = json.loads(json_str)
+                json_str = content
+                parsed = json_loads(json_str)
                 logger.debug(f"Parsed task command: {parsed}")
+                # Cache a copy so callers can't mutate the cached result
+                if isinstance(parsed, dict):
+                    self._response_cache.put(key, dict(parsed))
                 return parsed
             else:
                 raise Exception("No content in OpenAI response")
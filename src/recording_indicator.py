@@ -1,4 +1,7 @@
 #!/usr/bin/env python3
+import bisect
+import math
+from collections import deque
 import numpy as np
 from logger_config import setup_logging
 
@@ -8,16 +11,29 @@ logger = setup_logging()
 class RecordingIndicator:
     """Simple recording indicator using menu bar icon animation"""
 
+    # Icon per level bucket: a level above LEVEL_THRESHOLDS[i - 1] (and at most
+    # LEVEL_THRESHOLDS[i]) shows LEVEL_ICONS[i]
+    LEVEL_THRESHOLDS = (0.1, 0.4, 0.7)
+    LEVEL_ICONS = (
+        "⚪",  # White - very quiet/silence
+        "🟢",  # Green - quiet
+        "🟡",  # Yellow - medium
+        "🔴",  # Red - loud
+    )
+
     def __init__(self, width=50, height=300):
         # These parameters are kept for compatibility but not used
         self.width = width
         self.height = height
-        self.audio_levels = []
         self.max_bars = 20
+        # Rolling window of recent levels; the deque drops the oldest automatically
+        self.audio_levels = deque(maxlen=self.max_bars)
         self.running = False
         self.app_reference = None
         self.animation_frames = ["🔴", "🟠", "🟡", "🟢"]
         self.current_frame = 0
+        # Icon last written to the menu bar title
+        self._last_icon = None
 
     def set_app_reference(self, app):
         """Set reference to the main app for icon updates"""
@@ -29,12 +45,14 @@ class RecordingIndicator:
             return
 
         self.running = True
-        self.audio_levels = []
+        self.audio_levels = deque(maxlen=self.max_bars)
         self.current_frame = 0
+        self._last_icon = None
 
     def stop(self):
         """Stop the recording indicator"""
         self.running = False
+        self._last_icon = None
 
     def update_audio_level(self, audio_data):
         """Update the audio level based on incoming audio data
@@ -46,13 +64,14 @@ class RecordingIndicator:
             return
 
         try:
-            # Convert bytes to numpy array
-            audio_array = np.frombuffer(audio_data, dtype=np.int16)
+            # Convert bytes to numpy array (float32, so squaring can't overflow int16)
+            audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
+            if audio_array.size == 0:
+                return
 
-            # Calculate RMS (Root Mean Square) level
-            mean_square = np.mean(audio_array**2)
-            # Handle empty or zero arrays to avoid sqrt warning
-            rms = np.sqrt(mean_square) if mean_square > 0 else 0.0
+            # Calculate RMS (Root Mean Square) level; dot() squares and sums in one BLAS pass
+            mean_square = float(np.dot(audio_array, audio_array)) / audio_array.size
+            rms = math.sqrt(mean_square)
 
             # Normalize to 0-1 range
             max_rms = 3000
@@ -60,20 +79,13 @@ class RecordingIndicator:
 
             # Keep a rolling window of levels
             self.audio_levels.append(normalized_level)
-            if len(self.audio_levels) > self.max_bars:
-                self.audio_levels.pop(0)
-
-            # Update menu bar icon based on audio level
-            if normalized_level > 0.7:
-                icon = "🔴"  # Red - loud
-            elif normalized_level > 0.4:
-                icon = "🟡"  # Yellow - medium
-            elif normalized_level > 0.1:
-                icon = "🟢"  # Green - quiet
-            else:
-                icon = "⚪"  # White - very quiet/silence
-
-            # Animate the icon
-            self.app_reference.title = f"{icon} REC"
+
+            # Update menu bar icon based on audio level (bucket lookup in C, no if/elif chain)
+            icon = self.LEVEL_ICONS[bisect.bisect_left(self.LEVEL_THRESHOLDS, normalized_level)]
+
+            # Animate the icon; only touch the menu bar (a Cocoa redraw) when it changes
+            if icon != self._last_icon:
+                self.app_reference.title = f"{icon} REC"
+                self._last_icon = icon
         except Exception as e:
             logger.debug(f"Error updating audio level: {e}")
@@ -2,65 +2,317 @@
 # ABOUTME: Task management with CRUD operations, JSON storage, and GPT-based natural language parsing
 
 import os
+import re
 import json
 import uuid
 import difflib
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from logger_config import setup_logging
+try:
+    # Rust JSON codec: several times faster than the stdlib for large task files;
+    # its JSONDecodeError subclasses json.JSONDecodeError
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = setup_logging()
 
+# Fallback command grammar for _simple_parse. Word boundaries keep "address" from reading
+# as "add", and a priority needs the word "priority" ("high priority", "priority: high") so
+# "high level design" keeps its "high"; matching is case-insensitive so descriptions keep
+# the user's casing
+_COMMAND_RE = re.compile(r'^(?:(?:task|todo|to do)\b[\s,.:]*)?(?:(?P<action>add|complete|list|archive)\b)?[\s,.:]*(?P<rest>.*)$', re.DOTALL | re.IGNORECASE)
+_PRIORITY_RE = re.compile(
+    r'\b(?:(?P<priority>high|medium|low)\s+priority|priority\s*:?\s*(?P<priority_after>high|medium|low))\b',
+    re.IGNORECASE
+)
+# A priority word outside those forms ("low-hanging fruit") is ambiguous; left to GPT
+_BARE_PRIORITY_RE = re.compile(r'\b(?:high|medium|low)\b', re.IGNORECASE)
+_DUE_RE = re.compile(r'\b(?P<due>tomorrow|today)\b', re.IGNORECASE)
+# Words _simple_parse can't interpret (other dates, categories); "add" commands
+# containing any of them are left to GPT
+_WORD_RE = re.compile(r'\w+')
+_NEEDS_GPT_RE = re.compile(
+    r'\b(?:due|by|on|next|this|in|at|before|until|for|category|tag|week|weekend|month|tonight|'
+    r'(?:mon|tues|wednes|thurs|fri|satur|sun)day|'
+    r'january|february|march|april|may|june|july|august|september|october|november|december|'
+    r'jan|feb|mar|apr|jun|jul|aug|sep|sept|oct|nov|dec)\b|\d',
+    re.IGNORECASE
+)
+
+# list_tasks ordering: priority (high → medium → low → none), then due date (soonest first)
+_PRIORITY_ORDER = {'high': 0, 'medium': 1, 'low': 2, None: 3}
+
+# Task files with more tasks than this are saved as compact JSON: indentation roughly
+# doubles the bytes to encode, write and re-read, and nobody reads a file that long by hand
+COMPACT_SAVE_MIN_TASKS = 500
+
+# Mutations are appended to a log next to the task file; after this many log records the
+# log is folded back into a fresh JSON snapshot (see TaskManager.compact)
+COMPACT_AFTER_OPS = 500
+
+# Task files already checked/created by ensure_task_file in this process
+_ensured_task_files = set()
+
+
+def _task_sort_key(task):
+    """Sort key for list_tasks; tasks with no due date go last"""
+    return (_PRIORITY_ORDER.get(task.get('priority'), 3), task.get('due_date') or '9999-12-31')
+
+
+class DictStorage:
+    """In-memory task storage for TaskManager(storage=...); nothing touches the disk"""
+
+    def __init__(self, data=None):
+        self.data = data if data is not None else {'version': '1.0', 'tasks': []}
+
+    def load(self):
+        return self.data
+
+    def save(self, data):
+        self.data = data
+
+
 class TaskManager:
-    def __init__(self, openai_client=None, task_file=None):
+    def __init__(self, openai_client=None, task_file=None, storage=None):
         """
         Initialize TaskManager with OpenAI client for parsing and task file storage.
 
         Args:
             openai_client: OpenAI client instance for GPT parsing (optional)
             task_file: Path to task JSON file (defaults to ~/.whisper_tasks.json)
+            storage: Object with load() / save(data) used instead of the task file
+                     (e.g. DictStorage for tests)
         """
         self.openai_client = openai_client
+        self.storage = storage
         self.task_file = task_file or Path.home() / '.whisper_tasks.json'
-        self.ensure_task_file()
+        # Append-only mutation log replayed over the task file snapshot
+        self.log_file = self.task_file.with_suffix('.jsonl')
+
+        # Last loaded/saved task data and the file signature it corresponds to
+        self._cache = None
+        self._cache_signature = None
+        # Per-status task counts for the cached data (see _status_counts)
+        self._counts = None
+        # Id map and lowercased descriptions for the cached tasks (see _task_index)
+        self._index = None
+        # Records in the mutation log since the last snapshot
+        self._log_ops = 0
+        # Whether the cached data is the complete task state (a task file that parsed, or
+        # one rebuilt from the log); only then may a saved snapshot replace the log
+        self._snapshot_loaded = False
+
+        if storage is None:
+            self.ensure_task_file()
 
     def ensure_task_file(self):
-        """Create task file if it doesn't exist"""
-        if not self.task_file.exists():
+        """Create task file if it doesn't exist (checked once per file per process)"""
+        key = str(self.task_file)
+        if key in _ensured_task_files:
+            return
+        if not os.path.exists(key):
             logger.info(f"Creating new task file at {self.task_file}")
-            self._save_tasks({'version': '1.0', 'tasks': []})
+            self._rebuild_from_log()
+        _ensured_task_files.add(key)
+
+    def _rebuild_from_log(self):
+        """
+        Write a fresh task file from the mutation log alone, for when the task file is
+        missing or corrupt. The log is dropped only once the new snapshot is saved.
+
+        Returns:
+            dict: The rebuilt task data
+        """
+        data = {'version': '1.0', 'tasks': []}
+        self._replay_log(data)
+        # The rebuilt data holds everything the log does
+        self._snapshot_loaded = True
+        try:
+            self._save_tasks(data)
+        except Exception:
+            # Keep the log; the next load or compact tries again
+            self._snapshot_loaded = False
+        return data
+
+    def _file_signature(self):
+        """(mtime_ns, size, inode) of the task file and of the mutation log, or None if the
+        task file can't be stat'ed.
+
+        The inode changes on every atomic save, and size/mtime catch edits made in place
+        (and log appends), even when they land within the filesystem's timestamp granularity.
+        """
+        try:
+            st = os.stat(self.task_file)
+        except OSError:
+            return None
+        try:
+            log_st = os.stat(self.log_file)
+            log_signature = (log_st.st_mtime_ns, log_st.st_size, log_st.st_ino)
+        except OSError:
+            log_signature = None
+        return (st.st_mtime_ns, st.st_size, st.st_ino), log_signature
+
+    def _reset_derived(self):
+        """Drop values computed from the cached task data"""
+        self._counts = None
+        self._index = None
 
     def _load_tasks(self):
-        """Load tasks from JSON file"""
+        """Load tasks from JSON file, reusing the cached data while the file is unchanged"""
+        if self.storage is not None:
+            data = self.storage.load()
+            if data is not self._cache:
+                self._cache = data
+                self._reset_derived()
+            return data
+
+        signature = self._file_signature()
+        if self._cache is not None and signature is not None and signature == self._cache_signature:
+            return self._cache
+
         try:
-            with open(self.task_file, 'r') as f:
-                data = json.load(f)
-                return data
+            if ORJSON_AVAILABLE:
+                data = orjson.loads(self.task_file.read_bytes())
+            else:
+                with open(self.task_file, 'r') as f:
+                    data = json.load(f)
+            self._replay_log(data)
+            self._cache = data
+            self._cache_signature = signature
+            self._snapshot_loaded = True
+            self._reset_derived()
+            return data
         except json.JSONDecodeError as e:
             logger.error(f"Error parsing task file: {e}")
+            self._snapshot_loaded = False
             # Backup corrupted file
             backup_file = self.task_file.with_suffix('.json.backup')
             self.task_file.rename(backup_file)
             logger.info(f"Corrupted file backed up to {backup_file}")
-            # Create fresh file
-            self._save_tasks({'version': '1.0', 'tasks': []})
-            return {'version': '1.0', 'tasks': []}
+            # Create fresh file from whatever the mutation log still holds
+            return self._rebuild_from_log()
+        except FileNotFoundError:
+            # Deleted while the app runs (ensure_task_file only checks once per process)
+            logger.warning(f"Task file {self.task_file} is missing - rebuilding it from the mutation log")
+            return self._rebuild_from_log()
         except Exception as e:
             logger.error(f"Error loading tasks: {e}")
-            return {'version': '1.0', 'tasks': []}
+            self._snapshot_loaded = False
+            data = {'version': '1.0', 'tasks': []}
+            self._replay_log(data)
+            return data
+
+    def _replay_log(self, data):
+        """Apply the mutation log's records to snapshot data in place"""
+        try:
+            lines = self.log_file.read_bytes().splitlines()
+        except OSError:
+            lines = []
+        self._log_ops = len(lines)
+        if not lines:
+            return
+
+        # Replay is idempotent (adds are upserts, updates/deletes of unknown ids are
+        # skipped), so records already folded into the snapshot can be applied again
+        tasks = {task['id']: task for task in data.get('tasks', [])}
+        for line in lines:
+            try:
+                record = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+            except json.JSONDecodeError:
+                # A write cut short by a crash; every complete record is still applied
+                logger.warning(f"Skipping unreadable record in {self.log_file}")
+                continue
+            op = record.get('op')
+            if op == 'add':
+                tasks[record['task']['id']] = record['task']
+            elif op == 'update' and record['task']['id'] in tasks:
+                tasks[record['task']['id']] = record['task']
+            elif op == 'delete':
+                tasks.pop(record.get('id'), None)
+        data['tasks'] = list(tasks.values())
+
+    def _append_log(self, *records):
+        """
+        Persist mutations by appending them to the log instead of rewriting the task file.
+        The cached data must already reflect the change. Compacts once the log is long.
+        """
+        if self.storage is not None:
+            self._save_tasks(self._cache)
+            return
+
+        try:
+            if ORJSON_AVAILABLE:
+                lines = b''.join(orjson.dumps(record) + b'\n' for record in records)
+            else:
+                lines = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records).encode('utf-8')
+            with open(self.log_file, 'ab') as f:
+                f.write(lines)
+            self._log_ops += len(records)
+
+            # The cached data already includes what we just appended
+            self._cache_signature = self._file_signature()
+            self._reset_derived()
+        except Exception as e:
+            # Callers mutated the cached data before the failed write
+            self._cache = None
+            self._reset_derived()
+            logger.error(f"Error saving tasks: {e}")
+            raise
+
+        if self._log_ops >= COMPACT_AFTER_OPS:
+            self.compact()
+
+    def compact(self):
+        """Write the current tasks to a fresh task file snapshot and clear the mutation log"""
+        if self.storage is None and not self._snapshot_loaded:
+            # Re-read the task file (e.g. the one just rebuilt from the log) before folding
+            self._cache = None
+        data = self._load_tasks()
+        if self._log_ops and (self.storage is not None or self._snapshot_loaded):
+            self._save_tasks(data)
 
     def _save_tasks(self, data):
-        """Save tasks to JSON file using atomic write"""
+        """Save tasks to JSON file using atomic write; the snapshot supersedes the mutation log"""
+        if self.storage is not None:
+            self.storage.save(data)
+            self._cache = data
+            self._reset_derived()
+            return
+
         try:
             # Write to temporary file first
             temp_file = self.task_file.with_suffix('.json.tmp')
-            with open(temp_file, 'w') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            compact = len(data.get('tasks', ())) > COMPACT_SAVE_MIN_TASKS
+            if ORJSON_AVAILABLE:
+                # Same on-disk layout as the json.dump calls below
+                temp_file.write_bytes(orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2))
+            else:
+                with open(temp_file, 'w') as f:
+                    if compact:
+                        json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+                    else:
+                        json.dump(data, f, indent=2, ensure_ascii=False)
 
             # Atomic rename
             temp_file.replace(self.task_file)
+            # Safe to drop only now: if we crash first, replaying it over the new snapshot is a no-op.
+            # Data rebuilt without a readable snapshot keeps the log until a later compact
+            if self._snapshot_loaded:
+                self.log_file.unlink(missing_ok=True)
+                self._log_ops = 0
             logger.debug(f"Tasks saved to {self.task_file}")
+
+            # What we just wrote is the current file content
+            self._cache = data
+            self._cache_signature = self._file_signature()
+            self._reset_derived()
         except Exception as e:
+            # Callers may have mutated the cached data before the failed save
+            self._cache = None
+            self._reset_derived()
             logger.error(f"Error saving tasks: {e}")
             raise
 
@@ -75,23 +327,55 @@ class TaskManager:
         Returns:
             dict: Parsed command structure or None if parsing fails
         """
-        # Only use GPT parsing - no fallback
+        # Plain commands ("task add buy milk tomorrow", "task list") need no network round trip
+        parsed = self._local_parse(text)
+        if parsed:
+            logger.debug(f"Task command parsed locally: {parsed}")
+            return parsed
+
+        # Anything else needs GPT - no fallback
         if not self.openai_client or not self.openai_client.is_available():
             logger.error("OpenAI client not available - task parsing disabled")
             return None
 
         try:
-            current_date = datetime.now().strftime('%Y-%m-%d')
+            current_date = date.today().isoformat()
             parsed = self.openai_client.parse_task_command(text, current_date)
             return parsed
         except Exception as e:
             logger.error(f"Error with GPT parsing: {e}")
             return None
 
+    def _local_parse(self, text):
+        """
+        Parse a task command locally when _simple_parse can understand all of it.
+
+        Args:
+            text: Raw command text
+
+        Returns:
+            dict: Parsed command, or None if the command needs GPT
+        """
+        # Transcripts usually end with a full stop
+        text = text.strip().rstrip('.!?')
+        match = _COMMAND_RE.match(text)
+        action = match.group('action')
+        if action:
+            action = action.lower()
+        rest = match.group('rest').strip()
+
+        # No explicit action ("task buy milk"), a filtered list ("task list high priority")
+        # or nothing to add/complete/archive
+        if action is None or bool(rest) == (action == 'list'):
+            return None
+        if action == 'add' and (_NEEDS_GPT_RE.search(rest) or _BARE_PRIORITY_RE.search(_PRIORITY_RE.sub(' ', rest))):
+            return None
+        return self._simple_parse(text)
+
     def _simple_parse(self, text):
         """
         Simple fallback parser for basic task commands without GPT.
-        Handles: "task add DESCRIPTION [high/medium/low] [tomorrow/today]"
+        Handles: "task add DESCRIPTION [high/medium/low priority] [tomorrow/today]"
 
         Args:
             text: Raw command text
@@ -99,53 +383,33 @@ class TaskManager:
         Returns:
             dict: Parsed command or None
         """
-        text = text.strip().lower()
-
-        # Remove "task" or "todo" prefix
-        for prefix in ['task', 'todo', 'to do']:
-            if text.startswith(prefix):
-                text = text[len(prefix):].strip()
-                break
-
-        # Determine action
-        action = None
-        if text.startswith('add'):
-            action = 'add'
-            text = text[3:].strip()
-        elif text.startswith('complete'):
-            action = 'complete'
-            text = text[8:].strip()
-        elif text.startswith('list'):
-            action = 'list'
+        match = _COMMAND_RE.match(text.strip())
+        # Default to "add" if no action specified
+        action = (match.group('action') or 'add').lower()
+        text = match.group('rest')
+
+        if action == 'list':
             return {'action': 'list', 'filter': 'pending'}
-        elif text.startswith('archive'):
-            action = 'archive'
-            text = text[7:].strip()
-        else:
-            # Default to "add" if no action specified
-            action = 'add'
 
         if action == 'add':
             # Parse description, priority, and due date
             priority = None
             due_date = None
-            description = text
 
             # Extract priority
-            for p in ['high priority', 'medium priority', 'low priority', 'high', 'medium', 'low']:
-                if p in text:
-                    priority = p.replace(' priority', '')
-                    text = text.replace(p, '').strip()
-                    break
+            priority_match = _PRIORITY_RE.search(text)
+            if priority_match:
+                priority = (priority_match.group('priority') or priority_match.group('priority_after')).lower()
+                text = text[:priority_match.start()] + text[priority_match.end():]
 
             # Extract due date
-            today = datetime.now()
-            if 'tomorrow' in text:
-                due_date = (today + timedelta(days=1)).strftime('%Y-%m-%d')
-                text = text.replace('tomorrow', '').strip()
-            elif 'today' in text:
+            due_match = _DUE_RE.search(text)
+            if due_match:
+                today = datetime.now()
+                if due_match.group('due').lower() == 'tomorrow':
+                    today += timedelta(days=1)
                 due_date = today.strftime('%Y-%m-%d')
-                text = text.replace('today', '').strip()
+                text = text[:due_match.start()] + text[due_match.end():]
 
             # Clean up description
             description = ' '.join(text.split()).strip()
@@ -201,6 +465,40 @@ class TaskManager:
         Returns:
             dict: Created task
         """
+        task = self._new_task(description, priority, due_date, category)
+
+        data = self._load_tasks()
+        data['tasks'].append(task)
+        self._append_log({'op': 'add', 'task': task})
+
+        logger.info(f"Added task: {task['description']} (id: {task['id']})")
+        return task
+
+    def add_tasks(self, descriptions, priority=None, due_date=None, category=None):
+        """
+        Add several tasks with shared fields, persisting them in one write.
+
+        Args:
+            descriptions: Task descriptions
+            priority, due_date, category: As for add_task, applied to every task
+
+        Returns:
+            list: Created tasks
+        """
+        # Validate everything before changing anything
+        tasks = [self._new_task(description, priority, due_date, category) for description in descriptions]
+        if not tasks:
+            return tasks
+
+        data = self._load_tasks()
+        data['tasks'].extend(tasks)
+        self._append_log(*({'op': 'add', 'task': task} for task in tasks))
+
+        logger.info(f"Added {len(tasks)} tasks")
+        return tasks
+
+    def _new_task(self, description, priority, due_date, category):
+        """Validate add_task's arguments and build the task dict"""
         if not description:
             raise ValueError("Task description is required")
 
@@ -228,12 +526,6 @@ class TaskManager:
             'completed_at': None,
             'archived_at': None
         }
-
-        data = self._load_tasks()
-        data['tasks'].append(task)
-        self._save_tasks(data)
-
-        logger.info(f"Added task: {task['description']} (id: {task['id']})")
         return task
 
     def find_task(self, identifier):
@@ -246,35 +538,71 @@ class TaskManager:
         Returns:
             dict: Matched task or None
         """
+        return self._find_in(self._load_tasks().get('tasks', []), identifier)
+
+    def _find_in(self, tasks, identifier):
+        """
+        Find task by ID or fuzzy description match in already-loaded tasks.
+
+        Returns:
+            dict: The matched task object from tasks (mutable in place) or None
+        """
         if not identifier:
             return None
 
-        data = self._load_tasks()
-        tasks = data.get('tasks', [])
-
         identifier_lower = identifier.lower().strip()
+        by_id, entries, by_description_lower = self._task_index(tasks)
 
         # Try exact ID match first
-        for task in tasks:
-            if task['id'] == identifier:
-                return task
+        task = by_id.get(identifier)
+        if task is not None:
+            return task
 
         # Try substring match in description
-        for task in tasks:
-            if identifier_lower in task['description'].lower():
+        for description_lower, _, task in entries:
+            if identifier_lower in description_lower:
                 return task
 
-        # Try fuzzy matching using difflib
-        descriptions = [task['description'] for task in tasks]
-        matches = difflib.get_close_matches(identifier, descriptions, n=1, cutoff=0.6)
+        # Try word match: every word of the identifier appears in the description,
+        # in any order ("buy milk" → "Buy groceries and milk")
+        words = frozenset(_WORD_RE.findall(identifier_lower))
+        if words:
+            for _, description_words, task in entries:
+                if words <= description_words:
+                    return task
 
+        # Try fuzzy matching using difflib (catches misheard words)
+        matches = difflib.get_close_matches(identifier_lower, by_description_lower, n=1, cutoff=0.6)
         if matches:
-            for task in tasks:
-                if task['description'] == matches[0]:
-                    return task
+            return by_description_lower[matches[0]]
 
         return None
 
+    def _task_index(self, tasks):
+        """
+        Build the lookup structures _find_in searches: an id → task map,
+        (lowercased description, description word set, task) entries, and a
+        lowercased description → task map. Memoized while tasks is the cached task list.
+        """
+        cached = self._cache is not None and tasks is self._cache.get('tasks')
+        if cached and self._index is not None:
+            return self._index
+
+        by_id = {}
+        by_description_lower = {}
+        entries = []
+        for task in tasks:
+            description_lower = task['description'].lower()
+            # setdefault keeps the first task for an id/description, like the old linear scans
+            by_id.setdefault(task['id'], task)
+            by_description_lower.setdefault(description_lower, task)
+            entries.append((description_lower, frozenset(_WORD_RE.findall(description_lower)), task))
+        index = (by_id, entries, by_description_lower)
+
+        if cached:
+            self._index = index
+        return index
+
     def complete_task(self, identifier):
         """
         Mark task as completed.
@@ -285,21 +613,17 @@ class TaskManager:
         Returns:
             dict: Completed task or None if not found
         """
-        task = self.find_task(identifier)
+        data = self._load_tasks()
+        task = self._find_in(data.get('tasks', []), identifier)
         if not task:
             logger.warning(f"Task not found: {identifier}")
             return None
 
-        data = self._load_tasks()
-        for t in data['tasks']:
-            if t['id'] == task['id']:
-                t['status'] = 'completed'
-                t['completed_at'] = datetime.now().isoformat()
-                self._save_tasks(data)
-                logger.info(f"Completed task: {t['description']}")
-                return t
-
-        return None
+        task['status'] = 'completed'
+        task['completed_at'] = datetime.now().isoformat()
+        self._append_log({'op': 'update', 'task': task})
+        logger.info(f"Completed task: {task['description']}")
+        return task
 
     def uncomplete_task(self, identifier):
         """
@@ -311,21 +635,17 @@ class TaskManager:
         Returns:
             dict: Uncompleted task or None if not found
         """
-        task = self.find_task(identifier)
+        data = self._load_tasks()
+        task = self._find_in(data.get('tasks', []), identifier)
         if not task:
             logger.warning(f"Task not found: {identifier}")
             return None
 
-        data = self._load_tasks()
-        for t in data['tasks']:
-            if t['id'] == task['id']:
-                t['status'] = 'pending'
-                t['completed_at'] = None
-                self._save_tasks(data)
-                logger.info(f"Reopened task: {t['description']}")
-                return t
-
-        return None
+        task['status'] = 'pending'
+        task['completed_at'] = None
+        self._append_log({'op': 'update', 'task': task})
+        logger.info(f"Reopened task: {task['description']}")
+        return task
 
     def archive_task(self, identifier):
         """
@@ -337,21 +657,17 @@ class TaskManager:
         Returns:
             dict: Archived task or None if not found
         """
-        task = self.find_task(identifier)
+        data = self._load_tasks()
+        task = self._find_in(data.get('tasks', []), identifier)
         if not task:
             logger.warning(f"Task not found: {identifier}")
             return None
 
-        data = self._load_tasks()
-        for t in data['tasks']:
-            if t['id'] == task['id']:
-                t['status'] = 'archived'
-                t['archived_at'] = datetime.now().isoformat()
-                self._save_tasks(data)
-                logger.info(f"Archived task: {t['description']}")
-                return t
-
-        return None
+        task['status'] = 'archived'
+        task['archived_at'] = datetime.now().isoformat()
+        self._append_log({'op': 'update', 'task': task})
+        logger.info(f"Archived task: {task['description']}")
+        return task
 
     def list_tasks(self, filter_type='pending'):
         """
@@ -368,27 +684,21 @@ class TaskManager:
         tasks = data.get('tasks', [])
 
         if filter_type == 'all':
-            filtered = tasks
-        elif filter_type in ['pending', 'completed', 'archived']:
+            # Copy: the sort below must not reorder the cached task list
+            filtered = list(tasks)
+        elif filter_type in ('pending', 'completed', 'archived'):
             filtered = [t for t in tasks if t['status'] == filter_type]
-        elif filter_type in ['high', 'medium', 'low']:
+        elif filter_type in ('high', 'medium', 'low'):
             filtered = [t for t in tasks if t.get('priority') == filter_type and t['status'] == 'pending']
         elif filter_type == 'today':
-            today = datetime.now().strftime('%Y-%m-%d')
+            today = date.today().isoformat()
             filtered = [t for t in tasks if t.get('due_date') == today and t['status'] == 'pending']
         else:
             # Filter by category
             filtered = [t for t in tasks if t.get('category') == filter_type and t['status'] == 'pending']
 
         # Sort by priority (high → medium → low), then by due_date (soonest first)
-        priority_order = {'high': 0, 'medium': 1, 'low': 2, None: 3}
-
-        def sort_key(task):
-            priority_rank = priority_order.get(task.get('priority'), 3)
-            due_date = task.get('due_date') or '9999-12-31'  # Put tasks with no due date at end
-            return (priority_rank, due_date)
-
-        filtered.sort(key=sort_key)
+        filtered.sort(key=_task_sort_key)
         return filtered
 
     def get_tasks(self, limit=None, status='all'):
@@ -408,23 +718,34 @@ class TaskManager:
             return tasks[:limit]
         return tasks
 
+    def _status_counts(self):
+        """Count tasks per status in one pass, memoized until the task data changes"""
+        data = self._load_tasks()
+        if self._counts is not None and data is self._cache:
+            return self._counts
+
+        counts = {'pending': 0, 'completed': 0, 'archived': 0}
+        for t in data.get('tasks', []):
+            status = t['status']
+            if status in counts:
+                counts[status] += 1
+
+        # Only memoize counts for cached data (not the empty fallback after a load error)
+        if data is self._cache:
+            self._counts = counts
+        return counts
+
     def get_pending_count(self):
         """Get count of pending tasks"""
-        data = self._load_tasks()
-        tasks = data.get('tasks', [])
-        return len([t for t in tasks if t['status'] == 'pending'])
+        return self._status_counts()['pending']
 
     def get_completed_count(self):
         """Get count of completed tasks"""
-        data = self._load_tasks()
-        tasks = data.get('tasks', [])
-        return len([t for t in tasks if t['status'] == 'completed'])
+        return self._status_counts()['completed']
 
     def get_archived_count(self):
         """Get count of archived tasks"""
-        data = self._load_tasks()
-        tasks = data.get('tasks', [])
-        return len([t for t in tasks if t['status'] == 'archived'])
+        return self._status_counts()['archived']
 
     def delete_task(self, identifier):
         """
@@ -436,13 +757,13 @@ class TaskManager:
         Returns:
             bool: True if deleted, False if not found
         """
-        task = self.find_task(identifier)
+        data = self._load_tasks()
+        task = self._find_in(data.get('tasks', []), identifier)
         if not task:
             logger.warning(f"Task not found: {identifier}")
             return False
 
-        data = self._load_tasks()
-        data['tasks'] = [t for t in data['tasks'] if t['id'] != task['id']]
-        self._save_tasks(data)
+        data['tasks'] = [t for t in data['tasks'] if t is not task]
+        self._append_log({'op': 'delete', 'id': task['id']})
         logger.info(f"Deleted task: {task['description']}")
         return True
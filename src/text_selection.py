@@ -1,167 +1,234 @@
 #!/usr/bin/env python3
-import pyperclip
+import os
+import threading
 import time
+import Quartz
 from AppKit import NSPasteboard, NSStringPboardType
 from pynput.keyboard import Key, Controller
 from logger_config import setup_logging
 
 logger = setup_logging()
 
+# Concurrent NSPasteboard reads/writes from different threads can fail or crash AppKit, and
+# interleaved copy/paste sequences would restore each other's clipboard; every pasteboard
+# sequence below, and the app's own paste in main.py's insert_text, holds this lock
+# (reentrant: replace_selected_text calls _paste_text)
+_PASTEBOARD_LOCK = threading.RLock()
+
+# How long to wait for Cmd+C to land on the pasteboard before concluding nothing was selected
+COPY_TIMEOUT = 0.3
+# Text shorter than this is typed; longer text is pasted (one Cmd+V instead of an event per character)
+PASTE_MIN_CHARS = 4
+# Time for the target app to read the pasteboard after Cmd+V before the clipboard is restored.
+# Apps read it asynchronously, and slow ones (Electron apps, remote desktop, a busy app) can
+# take a few hundred ms; restoring too early pastes the user's previous clipboard instead of
+# the dictation. Longer values only delay the clipboard restore and the next paste
+PASTE_SETTLE = float(os.getenv('PASTE_SETTLE_SECONDS', '0.4'))
+# Virtual key codes of the shortcut letters on an ANSI (US) layout; only used when the
+# current layout's codes can't be looked up (AZERTY's A key, for one, is code 12, not 0)
+ANSI_KEYCODES = {'a': 0, 'f': 3, 'c': 8, 'v': 9}
+
 
 class TextSelection:
     def __init__(self):
         self.keyboard_controller = Controller()
+        # The general pasteboard is a process-wide singleton; look it up once
+        self.pasteboard = NSPasteboard.generalPasteboard()
+        # Cmd+<letter> shortcuts are posted as raw Quartz events (see _post_cmd_key), with key
+        # codes from the layout map pynput's macOS controller builds for the current layout
+        layout = getattr(self.keyboard_controller, '_mapping', None) or {}
+        self._cmd_keycodes = {ch: layout.get(ch, code) for ch, code in ANSI_KEYCODES.items()}
+        self._event_source = Quartz.CGEventSourceCreate(Quartz.kCGEventSourceStateHIDSystemState)
     
     def get_selected_text(self):
         """
-        Get currently selected text using clipboard manipulation.
+        Get currently selected text by copying it (Cmd+C) and restoring the clipboard.
         Returns the selected text or None if no text is selected.
         """
-        try:
-            # Save current clipboard content
-            original_clipboard = pyperclip.paste()
+        with _PASTEBOARD_LOCK:
+            try:
+                # Save current clipboard content (NSPasteboard directly: pyperclip forks pbcopy/pbpaste)
+                pasteboard = self.pasteboard
+                original_clipboard = pasteboard.stringForType_(NSStringPboardType)
+                initial_change_count = pasteboard.changeCount()
 
-            # Clear clipboard with a unique marker to detect if copy operation succeeds
-            marker = "___WHISPER_DICTATION_MARKER___"
-            pyperclip.copy(marker)
-            time.sleep(0.15)
+                # Copy selected text to clipboard
+                self._post_cmd_key('c')
 
-            # Copy selected text to clipboard
-            with self.keyboard_controller.pressed(Key.cmd):
-                self.keyboard_controller.press('c')
-                self.keyboard_controller.release('c')
+                # The change count increments when the copy lands; no change means nothing was selected
+                if not self._wait_for_pasteboard_change(initial_change_count, COPY_TIMEOUT):
+                    logger.debug("No text was selected (clipboard unchanged)")
+                    return None
 
-            # Longer delay to ensure copy operation completes
-            time.sleep(0.3)
+                # Get the copied text
+                selected_text = pasteboard.stringForType_(NSStringPboardType)
+                logger.debug(f"Clipboard after copy: '{selected_text[:100] if selected_text else 'None'}...'")
 
-            # Get the copied text
-            selected_text = pyperclip.paste()
-            logger.debug(f"Clipboard after copy: '{selected_text[:100] if selected_text else 'None'}...'")
+                # Restore original clipboard content
+                pasteboard.clearContents()
+                if original_clipboard is not None:
+                    pasteboard.setString_forType_(original_clipboard, NSStringPboardType)
 
-            # Restore original clipboard content
-            pyperclip.copy(original_clipboard)
+                if selected_text:
+                    logger.info(f"✓ Selected text captured ({len(selected_text)} chars)")
+                    return selected_text.strip()
 
-            # Return selected text if it changed from the marker (meaning copy succeeded)
-            if selected_text and selected_text != marker:
-                logger.info(f"✓ Selected text captured ({len(selected_text)} chars)")
-                return selected_text.strip()
+                logger.debug("No text was selected (copy had no text)")
+                return None
 
-            logger.debug("No text was selected (clipboard unchanged)")
-            return None
+            except Exception as e:
+                logger.error(f"Error getting selected text: {e}")
+                return None
 
-        except Exception as e:
-            logger.error(f"Error getting selected text: {e}")
-            return None
-    
-    def replace_selected_text(self, new_text, original_text=None):
+    def _post_cmd_key(self, char):
         """
-        Replace currently selected text with new text.
-        If original_text is provided, will find and replace it.
+        Post Cmd+char as one key-down/key-up pair with the Command flag set.
+        pynput's pressed(Key.cmd) sends four events and syncs its modifier state per call.
         """
-        try:
-            if original_text:
-                # Save current clipboard
-                original_clipboard = pyperclip.paste()
-
-                # Use Find & Replace approach (reliable timing)
-                # 1. Open Find (Cmd+F)
-                with self.keyboard_controller.pressed(Key.cmd):
-                    self.keyboard_controller.press('f')
-                    self.keyboard_controller.release('f')
-
-                time.sleep(0.3)
-
-                # 2. Type the original text to search for
-                self.keyboard_controller.type(original_text)
-                time.sleep(0.2)
-
-                # 3. Press Enter to find it
-                self.keyboard_controller.press(Key.enter)
-                self.keyboard_controller.release(Key.enter)
-                time.sleep(0.2)
+        keycode = self._cmd_keycodes[char]
+        for key_down in (True, False):
+            event = Quartz.CGEventCreateKeyboardEvent(self._event_source, keycode, key_down)
+            Quartz.CGEventSetFlags(event, Quartz.kCGEventFlagMaskCommand)
+            Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
 
-                # 4. Close Find dialog (Escape)
-                self.keyboard_controller.press(Key.esc)
-                self.keyboard_controller.release(Key.esc)
-                time.sleep(0.2)
-
-                # 5. Now the text should be selected, type replacement
-                self.keyboard_controller.type(new_text)
+    def _wait_for_pasteboard_change(self, initial_change_count, timeout):
+        """
+        Poll the pasteboard's change count until it moves past initial_change_count.
 
-                # Restore original clipboard
-                pyperclip.copy(original_clipboard)
+        Returns:
+            bool: True if the pasteboard changed within timeout
+        """
+        deadline = time.monotonic() + timeout
+        while self.pasteboard.changeCount() == initial_change_count:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.002)
+        return True
+
+    def _paste_text(self, text):
+        """
+        Insert text at the cursor (replacing any selection) by pasting it with Cmd+V,
+        then restore the clipboard. Very short text is typed instead.
+        """
+        with _PASTEBOARD_LOCK:
+            if len(text) < PASTE_MIN_CHARS:
+                self.keyboard_controller.type(text)
+                return
 
-                logger.info(f"✓ Replaced: '{original_text[:30]}...' → '{new_text[:30]}...'")
-            else:
-                # Simple approach - just type (works if text is still selected)
-                self.keyboard_controller.type(new_text)
-                logger.info(f"✓ Inserted: {new_text[:50]}...")
+            pasteboard = self.pasteboard
+            original_clipboard = pasteboard.stringForType_(NSStringPboardType)
+            try:
+                pasteboard.clearContents()
+                pasteboard.setString_forType_(text, NSStringPboardType)
+                self._post_cmd_key('v')
+                # Reading the pasteboard doesn't bump its change count, so there is nothing to poll
+                time.sleep(PASTE_SETTLE)
+            finally:
+                pasteboard.clearContents()
+                if original_clipboard is not None:
+                    pasteboard.setString_forType_(original_clipboard, NSStringPboardType)
 
-            return True
+    def replace_selected_text(self, new_text, original_text=None, use_find_replace=False):
+        """
+        Replace currently selected text with new text by pasting over the selection.
 
-        except Exception as e:
-            logger.error(f"Error replacing text: {e}")
-            # Try to restore clipboard on error
+        Args:
+            new_text: Replacement text
+            original_text: The text that was selected (for logging and Find & Replace)
+            use_find_replace: Re-select original_text with the app's Find (Cmd+F) first;
+                slower (~0.9s of UI delays), for apps where the selection was lost
+        """
+        with _PASTEBOARD_LOCK:
             try:
-                if 'original_clipboard' in locals():
-                    pyperclip.copy(original_clipboard)
-            except:
-                pass
-            return False
-    
+                if use_find_replace and original_text:
+                    # Find & Replace approach: the Find UI gives no readiness signal, so fixed delays
+                    # 1. Open Find (Cmd+F)
+                    self._post_cmd_key('f')
+
+                    time.sleep(0.3)
+
+                    # 2. Enter the original text to search for
+                    self._paste_text(original_text)
+                    time.sleep(0.2)
+
+                    # 3. Press Enter to find it
+                    self.keyboard_controller.press(Key.enter)
+                    self.keyboard_controller.release(Key.enter)
+                    time.sleep(0.2)
+
+                    # 4. Close Find dialog (Escape)
+                    self.keyboard_controller.press(Key.esc)
+                    self.keyboard_controller.release(Key.esc)
+                    time.sleep(0.2)
+
+                    # 5. Now the text should be selected, paste replacement
+                    self._paste_text(new_text)
+
+                    logger.info(f"✓ Replaced: '{original_text[:30]}...' → '{new_text[:30]}...'")
+                elif original_text:
+                    # The selection captured with Cmd+C is still active; paste over it
+                    self._paste_text(new_text)
+                    logger.info(f"✓ Replaced: '{original_text[:30]}...' → '{new_text[:30]}...'")
+                else:
+                    # Simple approach - just paste (works if text is still selected)
+                    self._paste_text(new_text)
+                    logger.info(f"✓ Inserted: {new_text[:50]}...")
+
+                return True
+
+            except Exception as e:
+                logger.error(f"Error replacing text: {e}")
+                return False
+
     def select_all_and_replace(self, new_text):
         """
         Select all text in current field and replace with new text.
         Fallback method when specific text selection fails.
         """
-        try:
-            # Select all text
-            with self.keyboard_controller.pressed(Key.cmd):
-                self.keyboard_controller.press('a')
-                self.keyboard_controller.release('a')
-            
-            time.sleep(0.1)
-            
-            # Type replacement text
-            self.keyboard_controller.type(new_text)
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error in select all and replace: {e}")
-            return False
-    
+        with _PASTEBOARD_LOCK:
+            try:
+                # Select all text; the app handles its key events in order, so the
+                # Cmd+V below can't overtake the Cmd+A
+                self._post_cmd_key('a')
+
+                # Paste replacement text
+                self._paste_text(new_text)
+                return True
+
+            except Exception as e:
+                logger.error(f"Error in select all and replace: {e}")
+                return False
+
     def get_selected_text_native(self):
         """
         Alternative method using NSPasteboard directly.
         This is a backup method that might work better in some scenarios.
         """
-        try:
-            # Get the general pasteboard
-            pasteboard = NSPasteboard.generalPasteboard()
-            
-            # Save current pasteboard content
-            original_content = pasteboard.stringForType_(NSStringPboardType)
-            
-            # Clear pasteboard
-            pasteboard.clearContents()
-            
-            # Copy selected text
-            with self.keyboard_controller.pressed(Key.cmd):
-                self.keyboard_controller.press('c')
-                self.keyboard_controller.release('c')
-            
-            time.sleep(0.2)
-            
-            # Get copied text
-            selected_text = pasteboard.stringForType_(NSStringPboardType)
-            
-            # Restore original content
-            if original_content:
+        with _PASTEBOARD_LOCK:
+            try:
+                pasteboard = self.pasteboard
+
+                # Save current pasteboard content
+                original_content = pasteboard.stringForType_(NSStringPboardType)
+
+                # Clear pasteboard
                 pasteboard.clearContents()
-                pasteboard.setString_forType_(original_content, NSStringPboardType)
-            
-            return selected_text.strip() if selected_text else None
-            
-        except Exception as e:
-            logger.error(f"Error with native text selection: {e}")
-            return None
\ No newline at end of file
+
+                # Copy selected text
+                self._post_cmd_key('c')
+
+                time.sleep(0.2)
+
+                # Get copied text
+                selected_text = pasteboard.stringForType_(NSStringPboardType)
+
+                # Restore original content
+                if original_content:
+                    pasteboard.clearContents()
+                    pasteboard.setString_forType_(original_content, NSStringPboardType)
+
+                return selected_text.strip() if selected_text else None
+
+            except Exception as e:
+                logger.error(f"Error with native text selection: {e}")
+                return None
\ No newline at end of file
@@ -10,21 +10,29 @@ import tempfile
 import json
 from pathlib import Path
 from datetime import datetime, timedelta
-from task_manager import TaskManager
+from task_manager import DictStorage, TaskManager
 
 class TestTaskManager(unittest.TestCase):
     def setUp(self):
-        """Create a temporary task file for each test"""
+        """Create an in-memory TaskManager and a temporary task file for the file-backed tests"""
         self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.json')
         self.temp_file.close()
-        self.task_manager = TaskManager(task_file=Path(self.temp_file.name))
+        self.task_manager = TaskManager(storage=DictStorage())
+
+    def _file_task_manager(self):
+        """TaskManager backed by the temporary task file"""
+        return TaskManager(task_file=Path(self.temp_file.name))
 
     def tearDown(self):
-        """Clean up temporary file"""
+        """Clean up temporary files"""
         Path(self.temp_file.name).unlink(missing_ok=True)
+        Path(self.temp_file.name).with_suffix('.jsonl').unlink(missing_ok=True)
 
     def test_task_file_creation(self):
         """Test that task file is created on init"""
+        # NamedTemporaryFile left an empty file behind; start from no file at all
+        Path(self.temp_file.name).unlink()
+        self._file_task_manager()
         self.assertTrue(Path(self.temp_file.name).exists())
 
         # Verify file structure
@@ -214,7 +222,7 @@ class TestTaskManager(unittest.TestCase):
 
     def test_json_persistence(self):
         """Test that tasks are persisted to JSON file"""
-        self.task_manager.add_task("Persistent task", priority="high")
+        self._file_task_manager().add_task("Persistent task", priority="high")
 
         # Create new TaskManager instance with same file
         new_manager = TaskManager(task_file=Path(self.temp_file.name))
@@ -260,12 +268,148 @@ class TestTaskManager(unittest.TestCase):
 
     def test_get_tasks_with_limit(self):
         """Test getting tasks with limit"""
-        for i in range(10):
-            self.task_manager.add_task(f"Task {i}")
+        self.task_manager.add_tasks([f"Task {i}" for i in range(10)])
 
         tasks = self.task_manager.get_tasks(limit=5)
         self.assertEqual(len(tasks), 5)
 
+    def test_external_edit_invalidates_cache(self):
+        """Test that changes written by another process are picked up"""
+        task_manager = self._file_task_manager()
+        task_manager.add_task("Cached task")
+        self.assertEqual(task_manager.get_pending_count(), 1)
+
+        # Another TaskManager (e.g. a second app instance) rewrites the file
+        other_manager = TaskManager(task_file=Path(self.temp_file.name))
+        other_manager.add_task("External task")
+
+        tasks = task_manager.list_tasks(filter_type='all')
+        self.assertEqual({t['description'] for t in tasks}, {"Cached task", "External task"})
+
+    def test_simple_parse(self):
+        """Test fallback parser extracts fields on whole words only"""
+        parsed = self.task_manager._simple_parse("task add follow up high priority tomorrow")
+        tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
+        self.assertEqual(parsed['action'], 'add')
+        self.assertEqual(parsed['description'], 'follow up')
+        self.assertEqual(parsed['priority'], 'high')
+        self.assertEqual(parsed['due_date'], tomorrow)
+
+        parsed = self.task_manager._simple_parse("todo address the slowness")
+        self.assertEqual(parsed['description'], 'address the slowness')
+        self.assertIsNone(parsed['priority'])
+
+        parsed = self.task_manager._simple_parse("task complete buy milk")
+        self.assertEqual(parsed['action'], 'complete')
+        self.assertEqual(parsed['identifier'], 'buy milk')
+
+    def test_simple_parse_keeps_description_case(self):
+        """Test that keywords match in any case while the description keeps its casing"""
+        parsed = self.task_manager._simple_parse("Task Add Call Bob at IBM High Priority Tomorrow")
+        tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
+        self.assertEqual(parsed['action'], 'add')
+        self.assertEqual(parsed['description'], 'Call Bob at IBM')
+        self.assertEqual(parsed['priority'], 'high')
+        self.assertEqual(parsed['due_date'], tomorrow)
+
+        parsed = self.task_manager._simple_parse("task add Highlight the Lowlands deck")
+        self.assertEqual(parsed['description'], 'Highlight the Lowlands deck')
+        self.assertIsNone(parsed['priority'])
+
+    def test_priority_words_inside_description(self):
+        """Test that a bare high/medium/low stays in the description instead of becoming the priority"""
+        parsed = self.task_manager._simple_parse("task add review high level design")
+        self.assertEqual(parsed['description'], 'review high level design')
+        self.assertIsNone(parsed['priority'])
+
+        parsed = self.task_manager._simple_parse("task add deploy fix priority: low")
+        self.assertEqual(parsed['description'], 'deploy fix')
+        self.assertEqual(parsed['priority'], 'low')
+
+        # Ambiguous on the local path, so left to GPT (not configured here)
+        self.assertIsNone(self.task_manager.parse_command("task add review high level design"))
+        self.assertIsNone(self.task_manager.parse_command("add low-hanging fruit cleanup"))
+
+    def test_parse_command_local_fast_path(self):
+        """Test that plain commands parse without GPT and others are left to it"""
+        parsed = self.task_manager.parse_command("Task add buy milk high priority today.")
+        self.assertEqual(parsed['action'], 'add')
+        self.assertEqual(parsed['description'], 'buy milk')
+        self.assertEqual(parsed['priority'], 'high')
+        self.assertEqual(parsed['due_date'], datetime.now().strftime('%Y-%m-%d'))
+
+        self.assertEqual(self.task_manager.parse_command("task list")['filter'], 'pending')
+        self.assertEqual(self.task_manager.parse_command("task complete buy milk")['identifier'], 'buy milk')
+
+        # Need GPT, which isn't configured here
+        self.assertIsNone(self.task_manager.parse_command("task add call mom on friday"))
+        self.assertIsNone(self.task_manager.parse_command("task list high priority"))
+        self.assertIsNone(self.task_manager.parse_command("task buy milk"))
+        self.assertIsNone(self.task_manager.parse_command("task complete"))
+
+    def test_mutation_log_replay_and_compaction(self):
+        """Test that mutations are logged, replayed by other instances, and compacted"""
+        task_manager = self._file_task_manager()
+        log_file = Path(self.temp_file.name).with_suffix('.jsonl')
+        keep = task_manager.add_task("Keep me")
+        gone = task_manager.add_task("Delete me")
+        task_manager.complete_task(keep['id'])
+        task_manager.delete_task(gone['id'])
+        self.assertEqual(len(log_file.read_text().splitlines()), 4)
+
+        other_manager = TaskManager(task_file=Path(self.temp_file.name))
+        tasks = other_manager.list_tasks(filter_type='all')
+        self.assertEqual([(t['description'], t['status']) for t in tasks], [("Keep me", 'completed')])
+
+        other_manager.compact()
+        self.assertFalse(log_file.exists())
+        with open(self.temp_file.name) as f:
+            self.assertEqual(len(json.load(f)['tasks']), 1)
+        self.assertEqual(task_manager.get_completed_count(), 1)
+
+    def test_mutation_log_survives_missing_or_corrupt_snapshot(self):
+        """Test that logged tasks are replayed, not discarded, when the task file is lost"""
+        task_manager = self._file_task_manager()
+        log_file = Path(self.temp_file.name).with_suffix('.jsonl')
+        task_manager.add_task("Logged task")
+
+        # Corrupt snapshot: rebuilt from the log, which is dropped once the rebuild is saved
+        with open(self.temp_file.name, 'w') as f:
+            f.write("invalid json{")
+        other_manager = TaskManager(task_file=Path(self.temp_file.name))
+        self.assertEqual([t['description'] for t in other_manager.list_tasks(filter_type='all')], ["Logged task"])
+        Path(self.temp_file.name).with_suffix('.json.backup').unlink()
+        self.assertFalse(log_file.exists())
+        with open(self.temp_file.name) as f:
+            self.assertEqual([t['description'] for t in json.load(f)['tasks']], ["Logged task"])
+
+        # Snapshot deleted while running: rebuilt from the tasks logged since the last compact
+        other_manager.add_task("Second task")
+        Path(self.temp_file.name).unlink()
+        third_manager = TaskManager(task_file=Path(self.temp_file.name))
+        self.assertEqual([t['description'] for t in third_manager.list_tasks(filter_type='all')], ["Second task"])
+        self.assertTrue(Path(self.temp_file.name).exists())
+        self.assertFalse(log_file.exists())
+
+        # Later mutations and compactions work as usual
+        third_manager.add_task("Third task")
+        self.assertTrue(log_file.exists())
+        third_manager.compact()
+        self.assertFalse(log_file.exists())
+        with open(self.temp_file.name) as f:
+            self.assertEqual(len(json.load(f)['tasks']), 2)
+
+    def test_large_task_file_saved_compact(self):
+        """Test that large task files are written without indentation and still load"""
+        tasks = [{'id': str(i), 'description': f"Task {i}", 'status': 'pending'} for i in range(501)]
+        self._file_task_manager()._save_tasks({'version': '1.0', 'tasks': tasks})
+
+        content = Path(self.temp_file.name).read_text()
+        self.assertNotIn('\n', content.strip())
+
+        other_manager = TaskManager(task_file=Path(self.temp_file.name))
+        self.assertEqual(other_manager.get_pending_count(), 501)
+
     def test_corrupted_json_recovery(self):
         """Test recovery from corrupted JSON file"""
         # Write invalid JSON